@@ -1,14 +1,42 @@
 """Main controller module for Lead Scraper."""
 from typing import Dict, List, Optional, Callable
+import csv
 import json
-import pandas as pd
 from datetime import datetime
+from openpyxl import Workbook
 from utils.logger import setup_logger
 from scrapers.google_maps import scrape as scrape_maps
 from scrapers.website import enrich as enrich_leads
 
 logger = setup_logger(__name__)
 
+def _export_columns(leads: List[Dict]) -> List[str]:
+    """Return every public key used by any lead, in first-seen order.
+    
+    Underscore-prefixed keys are internal bookkeeping, not lead data.
+    """
+    return list(dict.fromkeys(key for lead in leads for key in lead if not key.startswith('_')))
+
+def _cell(value):
+    """Flatten list and dict lead fields to text for spreadsheet cells."""
+    return value if value is None or isinstance(value, (str, int, float, bool)) else str(value)
+
+def _write_csv(path: str, leads: List[Dict], columns: List[str]) -> None:
+    """Write leads to a CSV file, leaving missing fields empty."""
+    with open(path, 'w', newline='', encoding='utf-8') as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=columns, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(leads)
+
+def _write_xlsx(path: str, leads: List[Dict], columns: List[str]) -> None:
+    """Write leads to an XLSX file, streaming rows instead of holding the sheet."""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(columns)
+    for lead in leads:
+        sheet.append([_cell(lead.get(column)) for column in columns])
+    workbook.save(path)
+
 class LeadController:
     """Coordinates scraping modules and data processing."""
     
@@ -65,9 +93,6 @@ class LeadController:
         Returns:
             Dictionary with paths to exported files
         """
-        # Convert leads to DataFrame
-        df = pd.DataFrame.from_records(leads)
-        
         # Generate timestamp and filenames
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         base_name = f"leads_{keyword}_{location}_{timestamp}"
@@ -75,9 +100,10 @@ class LeadController:
         xlsx_path = f"data/output/{base_name}.xlsx"
         json_path = f"data/output/{base_name}.json"
         
-        # Export to all formats
-        df.to_csv(csv_path, index=False)
-        df.to_excel(xlsx_path, index=False)
+        # Export to all formats; plain writers, no DataFrame needed
+        columns = _export_columns(leads)
+        _write_csv(csv_path, leads, columns)
+        _write_xlsx(xlsx_path, leads, columns)
         
         # Export to JSON with cleaner formatting
         clean_leads = self.clean_leads_for_export(leads)
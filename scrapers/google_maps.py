@@ -1,13 +1,34 @@
 """Google Maps scraper module for Lead Scraper project."""
-from typing import Dict, List, Optional
+from typing import IO, Dict, Iterator, List, Optional, Set, Tuple
 import argparse
+import atexit
+import errno
+import functools
+import itertools
+import json
+import os
+import sqlite3
+import tempfile
+import threading
 import time
 import random
 import re
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import shutil
+try:
+    import fcntl
+except ImportError:
+    # Windows has no fcntl; msvcrt byte-range locks serve the same purpose
+    fcntl = None
+    import msvcrt
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import quote_plus, unquote_plus
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
@@ -16,16 +37,19 @@ from selenium.common.exceptions import (
     TimeoutException,
     ElementClickInterceptedException,
     ElementNotInteractableException,
+    JavascriptException,
     WebDriverException
 )
-from webdriver_manager.chrome import ChromeDriverManager
 from utils.logger import setup_logger
 from utils.decorators import retry_with_backoff
-from utils.web import setup_chrome_driver
+from utils.web import DriverPool, TokenBucket, attach_chrome_driver, chromedriver_path, setup_chrome_driver
 
 # Initialize logger
 logger = setup_logger(__name__)
 
+# Search results page; the URL-encoded query is appended
+MAPS_SEARCH_URL = 'https://www.google.com/maps/search/'
+
 # Selector constants for easy testing override
 SEARCH_BOX = 'input#searchboxinput'
 SEARCH_BUTTON = 'button#searchbox-searchbutton'
@@ -35,8 +59,242 @@ TITLE_IN_LIST = 'div.qBF1Pd, span.fontHeadlineSmall'
 RATING_IN_LIST = 'span.MW4etd, span[aria-label*="rating"]'
 ADDRESS_IN_LIST = 'div.W4Efsd:last-child, span[jstcache*="address"]'
 SCROLL_PANE = 'div[role="feed"], div.section-scrollbox'
+END_OF_LIST = 'span.HlvSq'
 MODAL_CLOSE_BTN = 'button[aria-label="Close"], button[jsaction*="modal.close"]'
 
+# Fallback selector chains, most specific first
+_CONTAINER_SELECTORS = (SCROLL_PANE, 'div.section-result')
+_RESULT_SELECTORS = (
+    RESULT_ITEMS,
+    RESULT_LIST + ' > *',
+    'div.section-result',
+    'a[href^="https://www.google.com/maps/place"]'
+)
+_RESULT_WAIT_SELECTORS = _RESULT_SELECTORS[:3]
+# Comma-joined forms for waits, where any match will do
+CONTAINER_SEL = ', '.join(_CONTAINER_SELECTORS)
+RESULT_WAIT_SEL = ', '.join(_RESULT_WAIT_SELECTORS)
+_TITLE_SELECTORS = (TITLE_IN_LIST, 'div.qBF1Pd', 'span.fontHeadlineSmall', 'div.fontHeadlineSmall', 'h3')
+_RATING_SELECTORS = (RATING_IN_LIST, 'span.MW4etd', 'span[aria-label*="rating"]', 'span[aria-label*="stars"]')
+_REVIEW_SELECTORS = ('span.UY7F9', 'span[aria-label*="review"]')
+_PLACE_LINK_SELECTORS = ('a.hfpxzc', 'a', 'a[href*="maps/place"]', 'a[data-item-id*="place"]')
+# SCROLL_PANE already lists the feed and scrollbox; '.section-layout' stays
+# separate since it can wrap them and would win in DOM order
+_SCROLL_SELECTORS = (SCROLL_PANE, '.section-layout')
+_URL_CONTAINER_SELECTORS = (
+    '[role="article"]',     # New layout
+    'div.Nv2PK',            # Alternative layout
+    'a[href*="/place/"]',   # Direct place links
+    'div.bfdHYd'            # Older layout
+)
+
+# Selectors that matched last time, tried first on the next probe.
+# Kept per thread so concurrent scrapes don't share layouts.
+_winning_selector = threading.local()
+
+# Collects every [data-item-id] element of the details pane
+_DATA_ITEMS_EXPR = """Array.from(
+    document.querySelectorAll('[data-item-id]'), el => {
+        const value = el.querySelector('div.Io6YTe');
+        return {
+            id: el.getAttribute('data-item-id'),
+            tag: el.tagName.toLowerCase(),
+            href: el.getAttribute('href') ? el.href : null,
+            text: value ? value.innerText : el.innerText
+        };
+    }
+)"""
+DATA_ITEMS_JS = f"return {_DATA_ITEMS_EXPR};"
+
+# Listing detail fields as (key, css selector, value kind). Entries sharing
+# a key are fallbacks; the first selector that matches wins.
+FIELD_SELECTORS = (
+    ('name', 'h1.DUwDvf', 'text'),
+    ('fallbackName', 'h1.DUwDvf span, h1.DUwDvf.lfPIob span, h1.fontHeadlineLarge', 'text'),
+    ('fallbackName', 'h1, h2.fontHeadlineLarge, div.fontHeadlineLarge', 'text'),
+    ('rating', '.F7nice span[aria-hidden="true"]', 'text'),
+    ('reviews', 'span[aria-label*="reviews"]', 'text'),
+    ('phone', 'button[data-item-id^="phone:tel:"] div', 'text'),
+    ('website', 'a[data-item-id="authority"]', 'href'),
+    ('socials', 'a[data-item-id*="social"]', 'hrefs'),
+    ('hours', 'button[data-item-id*="oh"]', 'text'),
+)
+
+# Side-panel fields read by generic_parse_details, in the same format
+DETAILS_FIELD_SELECTORS = (
+    ('name', 'h1.DUwDvf span, h1.DUwDvf.lfPIob span, h1.fontHeadlineLarge', 'text'),
+    ('name', 'h1, h1.fontHeadlineLarge, h2.fontHeadlineLarge, div.fontHeadlineLarge', 'text'),
+    ('rating', 'div.F7nice span[aria-hidden="true"]', 'text'),
+    ('reviews', 'span.UY7F9, button.fontTitleSmall span', 'text'),
+)
+
+# Reads FIELD_SELECTORS (passed as arguments[0]) and every data-item-id
+# entry in a single WebDriver round-trip
+EXTRACT_JS = f"""
+const out = {{}};
+for (const [key, sel, kind] of arguments[0]) {{
+    if (out[key] != null) continue;
+    if (kind === 'hrefs') {{
+        out[key] = Array.from(document.querySelectorAll(sel), a => a.href);
+        continue;
+    }}
+    const el = document.querySelector(sel);
+    if (el) out[key] = kind === 'href' ? el.href : el.innerText;
+}}
+out.items = {_DATA_ITEMS_EXPR};
+return out;
+"""
+
+# EXTRACT_JS bound to FIELD_SELECTORS as a standalone expression, for
+# evaluation through CDP Runtime.evaluate
+EXTRACT_EXPR = f"(function() {{{EXTRACT_JS}}}).apply(null, {json.dumps([FIELD_SELECTORS])})"
+
+# Fallback selector lists for a result card in the list view
+RESULT_CARD_SELECTORS = {
+    'title': _TITLE_SELECTORS,
+    'titleLabel': ('a.hfpxzc[aria-label]',),
+    'address': (ADDRESS_IN_LIST,),
+    'rating': _RATING_SELECTORS,
+    'reviews': _REVIEW_SELECTORS,
+    'place': _PLACE_LINK_SELECTORS,
+    'website': ('a[href^="http"]:not([href*="google"])',),
+}
+
+# Reads every field of a result card (arguments[0]) in one round-trip, trying
+# the RESULT_CARD_SELECTORS lists (arguments[1]) in order
+RESULT_CARD_JS = """
+const [card, sel] = arguments;
+const first = (selectors, read) => {
+    for (const s of selectors) {
+        const el = card.querySelector(s);
+        const value = el && read(el);
+        if (value) return value;
+    }
+    return null;
+};
+const text = el => el.innerText.trim();
+return {
+    business_name: first(sel.title, text) || first(sel.titleLabel, el => el.getAttribute('aria-label')),
+    address: first(sel.address, text),
+    rating_text: first(sel.rating, el => text(el) || el.getAttribute('aria-label')),
+    reviews: first(sel.reviews, text),
+    place_url: first(sel.place, el => el.href && el.href.includes('maps/place') ? el.href : null),
+    website: first(sel.website, el => el.href)
+};
+"""
+
+# Every result card on the page read through RESULT_CARD_JS, as a standalone
+# expression for CDP Runtime.evaluate; the first result selector with any
+# matches decides which elements count as cards
+RESULT_CARDS_EXPR = f"""(() => {{
+    const readCard = function() {{{RESULT_CARD_JS}}};
+    for (const selector of {json.dumps(_RESULT_SELECTORS)}) {{
+        const cards = document.querySelectorAll(selector);
+        if (cards.length) {{
+            return Array.from(cards, card => readCard(card, {json.dumps(RESULT_CARD_SELECTORS)}));
+        }}
+    }}
+    return [];
+}})()"""
+
+# Scrolls the results pane (arguments[0]) to the bottom and calls back once
+# the number of cards matching arguments[1] grows, Maps shows its
+# end-of-list marker (arguments[3]), or after arguments[2] ms. Reports
+# 'bottom' without scrolling if the pane is already at its end.
+SCROLL_AND_WAIT_JS = """
+const [pane, itemSelector, timeoutMs, endSelector, done] = arguments;
+const start = pane.scrollTop;
+if (pane.querySelector(endSelector) || start + pane.clientHeight >= pane.scrollHeight) {
+    done({status: 'bottom', from: start, to: start});
+    return;
+}
+const count = () => pane.querySelectorAll(itemSelector).length;
+const before = count();
+const finish = status => {
+    observer.disconnect();
+    clearTimeout(timer);
+    done({status: status, from: start, to: pane.scrollTop});
+};
+const observer = new MutationObserver(() => {
+    if (count() > before) finish('loaded');
+    else if (pane.querySelector(endSelector)) finish('end');
+});
+observer.observe(pane, {childList: true, subtree: true});
+const timer = setTimeout(() => finish('timeout'), timeoutMs);
+pane.scrollTo({top: pane.scrollHeight});
+"""
+
+# Number of elements matching arguments[0], without marshalling any of them
+COUNT_JS = "return document.querySelectorAll(arguments[0]).length;"
+
+# Listing URLs from the first container selector in arguments[0] with any
+# matches, capped at arguments[1] containers, in a single round-trip
+LISTING_URLS_JS = """
+const [selectors, limit] = arguments;
+for (const selector of selectors) {
+    const results = document.querySelectorAll(selector);
+    if (!results.length) continue;
+    const urls = [];
+    for (const el of Array.from(results).slice(0, limit)) {
+        let url = el.tagName === 'A' ? el.href : null;
+        if (!url) {
+            const anchor = el.querySelector('a[href*="/place/"]');
+            url = anchor && anchor.href;
+        }
+        if (!url && el.getAttribute('data-place-id')) {
+            url = 'https://www.google.com/maps/place/?q=place_id:' + el.getAttribute('data-place-id');
+        }
+        if (url && url.includes('/place/')) urls.push(url);
+    }
+    return {
+        selector: selector,
+        count: results.length,
+        urls: urls,
+        firstHtml: urls.length ? null : results[0].outerHTML
+    };
+}
+return null;
+"""
+
+# Numeric part of a rating label such as "4.5 stars"
+_RATING_RE = re.compile(r'(\d+(?:\.\d+)?)(?:\s*stars?)?', re.IGNORECASE)
+
+# Matches data-item-id keys that carry the business name
+# ('name:', 'place_name:', 'title:', 'heading:')
+_NAME_KEY_RE = re.compile(r'name:|title:|heading:', re.IGNORECASE)
+
+# Every non-digit in a phone, including non-ASCII separators such as
+# U+00A0, U+2011, U+202F and fullwidth punctuation
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# Cookie-consent buttons: the XPath filters inside ChromeDriver and the
+# regex confirms against the rendered button text
+_CONSENT_RE = re.compile(r'accept|agree|consent', re.IGNORECASE)
+_LOWERCASE_TEXT = "translate(., 'ACEGNOPRST', 'acegnoprst')"
+CONSENT_BUTTONS_XPATH = (
+    f"//button[contains({_LOWERCASE_TEXT}, 'accept') or "
+    f"contains({_LOWERCASE_TEXT}, 'agree') or "
+    f"contains({_LOWERCASE_TEXT}, 'consent')]"
+)
+
+# Locator tuples built once and handed straight to find_elements/waits
+RESULT_LIST_LOC = (By.CSS_SELECTOR, RESULT_LIST)
+CONSENT_BUTTONS_LOC = (By.XPATH, CONSENT_BUTTONS_XPATH)
+LISTING_TITLE_LOC = (By.CSS_SELECTOR, 'h1.DUwDvf')
+
+# A search page is usable once either the results list or a consent prompt shows
+RESULTS_OR_CONSENT_COND = EC.any_of(
+    EC.presence_of_element_located(RESULT_LIST_LOC),
+    EC.presence_of_element_located(CONSENT_BUTTONS_LOC)
+)
+LISTING_TITLE_COND = EC.presence_of_element_located(LISTING_TITLE_LOC)
+
+# Translation table that drops the parentheses around review counts
+_PAREN_TABLE = str.maketrans('', '', '()')
+
+# Translation table that turns domain separators into spaces
+_DOMAIN_SEP_TABLE = str.maketrans('-.', '  ')
+
 # User agent list for randomization
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -45,40 +303,230 @@ USER_AGENTS = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36"
 ]
 
+# Resources the listing workers never read, blocked via CDP
+BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.svg", "*.mp4",
+    "*.woff2", "*.woff", "*.ttf", "*.css",
+    "*/maps/vt*", "*/tile?*",
+    "*googletagmanager*", "*google-analytics*", "*doubleclick*"
+)
+
+# Resources the search page can do without; stylesheets stay since the
+# results feed is driven through the rendered layout
+SEARCH_BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.svg", "*.mp4",
+    "*.woff2", "*.woff", "*.ttf",
+    "*/maps/vt*", "*/tile?*",
+    "*googleads*", "*doubleclick*"
+)
+
+# The XHR Maps issues for a search and for every further page of results;
+# its JSON body carries the listed places
+SEARCH_XHR_MARKERS = ('/search?', 'tbm=map')
+_XSSI_PREFIX = ")]}'"
+
+# Place name segment of a /maps/place/<name>/... listing URL
+_PLACE_NAME_RE = re.compile(r'/maps/place/([^/?#]+)')
+
+# Place pages embed the same place array in their initial state, so plain
+# HTTP is enough when Google serves the page without a consent redirect
+_APP_STATE_RE = re.compile(r'window\.APP_INITIALIZATION_STATE=(.*?);window\.APP_FLAGS', re.DOTALL)
+# The same state as a live page global, for listings opened in a browser
+APP_STATE_EXPR = "window.APP_INITIALIZATION_STATE || null"
+
+# Shared HTTP session: pooled keep-alive connections for every worker thread,
+# with transient failures retried at the transport level
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+))
+_SESSION.headers.update({"User-Agent": USER_AGENTS[0], "Accept-Language": "en-US,en;q=0.9"})
+atexit.register(_SESSION.close)
+
+# Throttle for listing page loads, shared by all worker threads
+MAPS_MIN_DELAY = float(os.getenv('MAPS_MIN_DELAY', '1.0'))
+MAPS_MAX_DELAY = float(os.getenv('MAPS_MAX_DELAY', '2.0'))
+MAPS_MAX_CONCURRENT = int(os.getenv('MAPS_MAX_CONCURRENT', '5'))
+MAPS_RATE_CALLS = int(os.getenv('MAPS_RATE_CALLS', '10'))
+MAPS_RATE_PERIOD = float(os.getenv('MAPS_RATE_PERIOD', '10.0'))
+# Minimum seconds between search submissions, across all search drivers
+MAPS_SEARCH_INTERVAL = float(os.getenv('MAPS_SEARCH_INTERVAL', '2.0'))
+# Run the search browser headless too (listing browsers always are)
+MAPS_HEADLESS = os.getenv('MAPS_HEADLESS', '0') == '1'
+
+# Anti-detection jitter in random_sleep; set MAPS_JITTER=0 for tests and
+# benchmarks to measure real page latency
+MAPS_JITTER = os.getenv('MAPS_JITTER', '1') == '1'
+_rate_tokens = threading.BoundedSemaphore(MAPS_MAX_CONCURRENT)
+_rate_lock = threading.Lock()
+_rate_next_slot = 0.0
+
+# Listing drivers run on persistent per-slot profiles so the Maps JS bundle
+# stays in the HTTP cache across drivers and runs
+CHROME_PROFILE_ROOT = os.getenv(
+    'MAPS_PROFILE_DIR', os.path.join(tempfile.gettempdir(), 'leads-chrome-profiles')
+)
+CHROME_DISK_CACHE_BYTES = 256 * 1024 * 1024
+# Listing pools run up to 10 workers; the margin covers a second scraper
+# process. Past this many slots a driver gets a throwaway profile.
+CHROME_PROFILE_SLOTS = int(os.getenv('MAPS_PROFILE_SLOTS', '16'))
+_profile_lock = threading.Lock()
+# Slot -> open lock file; the OS lock keeps other processes off the slot
+_profiles_in_use: Dict[int, IO] = {}
+# What a non-blocking lock raises when another process holds it
+_LOCK_HELD_ERRNOS = {errno.EWOULDBLOCK, errno.EAGAIN} if fcntl is not None else {errno.EACCES}
+
+# Caps sustained listing loads while still letting idle workers burst;
+# taken once per listing by _rate_limited
+LIMITER = TokenBucket(max_calls=MAPS_RATE_CALLS, period=MAPS_RATE_PERIOD)
+
+# Searches are what Google answers with a CAPTCHA first; space them out up
+# front instead of leaving it to retry_with_backoff
+SEARCH_LIMITER = TokenBucket(max_calls=1, period=MAPS_SEARCH_INTERVAL)
+
 def random_sleep(min_seconds=1, max_seconds=3):
-    """Sleep for a random amount of time within range."""
-    time.sleep(random.uniform(min_seconds, max_seconds))
+    """Sleep for a random amount of time within range, unless MAPS_JITTER=0."""
+    if MAPS_JITTER:
+        time.sleep(random.uniform(min_seconds, max_seconds))
+
+def _wait_ready(driver, max_ms: int = 1500) -> None:
+    """Poll until the document is loaded and no modal is open, up to max_ms."""
+    end = time.monotonic() + max_ms / 1000
+    while time.monotonic() < end:
+        try:
+            if driver.execute_script(
+                "return document.readyState === 'complete' && "
+                "!document.querySelector(arguments[0]);",
+                MODAL_CLOSE_BTN
+            ):
+                return
+        except WebDriverException:
+            pass
+        time.sleep(0.05)
+
+def cdp_evaluate(driver, expression: str):
+    """
+    Evaluate a JavaScript expression through CDP and return its value.
+    
+    Skips the WebDriver execute_script wrapping and element marshalling;
+    the result must be JSON-serializable.
+    
+    Args:
+        driver: Chrome WebDriver instance
+        expression: JavaScript expression to evaluate in the page
+        
+    Returns:
+        The expression's value, deserialized
+        
+    Raises:
+        JavascriptException: If the expression throws
+    """
+    response = driver.execute_cdp_cmd(
+        "Runtime.evaluate", {"expression": expression, "returnByValue": True}
+    )
+    if 'exceptionDetails' in response:
+        details = response['exceptionDetails']
+        raise JavascriptException(details.get('exception', {}).get('description') or details.get('text'))
+    return response['result'].get('value')
+
+def wait_for_network_idle(driver, timeout: float = 10, quiet_polls: int = 2) -> bool:
+    """
+    Wait until the page has loaded and stopped requesting new resources.
+    
+    The resource-timing entry count must hold steady for quiet_polls
+    consecutive polls after document.readyState reaches 'complete'.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        timeout: Upper bound on the wait in seconds
+        quiet_polls: Number of unchanged polls that count as idle
+        
+    Returns:
+        True if the page went idle, False if the timeout was hit
+    """
+    state = {'count': -1, 'quiet': 0}
+    
+    def network_idle(d) -> bool:
+        ready, count = d.execute_script(
+            "return [document.readyState, "
+            "performance.getEntriesByType('resource').length];"
+        )
+        if ready != 'complete' or count != state['count']:
+            state['count'] = count
+            state['quiet'] = 0
+            return False
+        state['quiet'] += 1
+        return state['quiet'] >= quiet_polls
+    
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.25).until(network_idle)
+        return True
+    except TimeoutException:
+        logger.debug(f"Network did not go idle within {timeout}s")
+        return False
+
+def wait_for(driver, selector, timeout: float = 10, condition=EC.presence_of_element_located):
+    """Wait until condition holds for selector, polling every 100ms.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        selector: CSS selector or (By, value) locator tuple to wait on
+        timeout: Maximum time to wait in seconds
+        condition: Expected condition factory taking a locator tuple
+        
+    Returns:
+        Whatever the condition returns (usually the element), or None on timeout
+    """
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            condition(_locator(selector))
+        )
+    except TimeoutException:
+        logger.debug(f"Timed out after {timeout}s waiting for {selector}")
+        return None
+
+def _locator(selector) -> tuple:
+    """Return selector as a (By, value) locator; plain strings are CSS."""
+    return selector if isinstance(selector, tuple) else (By.CSS_SELECTOR, selector)
 
-def wait_and_find_element(driver, selector: str, timeout: int = 10, retry_on_stale=True):
-    """Wait for and return an element with stale element handling."""
+def _first(container, selector):
+    """Return the first element under container matching selector, or None."""
+    elements = container.find_elements(*_locator(selector))
+    return elements[0] if elements else None
+
+def wait_and_find_element(driver, selector, timeout: int = 10, retry_on_stale=True, require_clickable=False):
+    """Wait for and return an element with stale element handling.
+    
+    selector is a CSS string or a prebuilt (By, value) locator tuple. Only
+    elements about to be clicked need require_clickable; its visibility and
+    enabled checks cost extra round-trips on every poll.
+    """
     max_retries = 3 if retry_on_stale else 1
+    condition = EC.element_to_be_clickable if require_clickable else EC.presence_of_element_located
     
     for attempt in range(max_retries):
         try:
-            element = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-            )
-            # Try to ensure element is ready for interaction
-            WebDriverWait(driver, 2).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+            # A single wait, polled at 100ms
+            return WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                condition(_locator(selector))
             )
-            return element
         except StaleElementReferenceException:
             if attempt == max_retries - 1:
                 logger.warning(f"Element went stale after {max_retries} attempts: {selector}")
                 return None
-            random_sleep(0.5, 1.5)
+            # The next attempt looks the element up again; no need to sleep first
         except TimeoutException:
             logger.warning(f"Timeout waiting for element: {selector}")
             return None
 
-def wait_and_find_elements(driver, selector: str, timeout: int = 10):
-    """Wait for and return multiple elements."""
+def wait_and_find_elements(driver, selector, timeout: int = 10):
+    """Wait for and return multiple elements matching a CSS string or locator tuple."""
     try:
-        WebDriverWait(driver, timeout).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+        return WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            EC.presence_of_all_elements_located(_locator(selector))
         )
-        return driver.find_elements(By.CSS_SELECTOR, selector)
     except TimeoutException:
         logger.warning(f"Timeout waiting for elements: {selector}")
         return []
@@ -99,29 +547,27 @@ def safe_click(driver, element, retries: int = 3, js_click_fallback=True):
     for i in range(retries):
         try:
             if isinstance(element, str):
-                element = wait_and_find_element(driver, element)
+                element = wait_and_find_element(driver, element, require_clickable=True)
             
             if not element:
                 return False
                 
             # Scroll element into view
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
-            random_sleep(0.5, 1.5)  # Let the page settle
+            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+            WebDriverWait(driver, 5, poll_frequency=0.1).until(EC.element_to_be_clickable(element))
             
             # Try regular click
             element.click()
             return True
             
-        except (ElementClickInterceptedException, ElementNotInteractableException) as e:
+        except (ElementClickInterceptedException, ElementNotInteractableException, TimeoutException) as e:
             logger.warning(f"Click attempt {i+1} failed: {str(e)}")
             
             # Check for and close any modals that might be in the way
-            try:
-                modal_close = driver.find_element(By.CSS_SELECTOR, MODAL_CLOSE_BTN)
+            modal_close = _first(driver, MODAL_CLOSE_BTN)
+            if modal_close:
                 modal_close.click()
-                random_sleep(1, 2)
-            except NoSuchElementException:
-                pass
+                _wait_ready(driver)
             
             # Try JavaScript click on last attempt or if fallback is enabled
             if js_click_fallback and i >= retries - 2:
@@ -131,65 +577,48 @@ def safe_click(driver, element, retries: int = 3, js_click_fallback=True):
                 except WebDriverException as js_e:
                     logger.warning(f"JavaScript click failed: {str(js_e)}")
                     
-            random_sleep(1, 2)  # Wait before retry
+            _wait_ready(driver, max_ms=500 * 2 ** i)  # Wait before retry
             
         except StaleElementReferenceException:
             if i == retries - 1:
                 logger.warning(f"Element went stale after {retries} attempts")
                 return False
-            random_sleep(1, 1.5)
+            _wait_ready(driver, max_ms=500 * 2 ** i)
         
         except Exception as e:
             logger.error(f"Click error: {str(e)}")
             if i == retries - 1:
                 return False
-            random_sleep(1, 2)
+            _wait_ready(driver, max_ms=500 * 2 ** i)
             
     return False
 
+def _prefer_winner(kind: str, selectors: tuple) -> tuple:
+    """Order selectors so the one that last matched for kind comes first."""
+    winner = getattr(_winning_selector, kind, None)
+    if winner in selectors and winner != selectors[0]:
+        return (winner,) + tuple(s for s in selectors if s != winner)
+    return selectors
+
 def wait_for_results(driver, timeout: int = 20) -> bool:
     """Wait for and verify that results are loaded."""
     try:
-        # Wait for either the feed container or older-style results
-        scroll_pane_present = False
-        for selector in [SCROLL_PANE, 'div.section-result']:
-            try:
-                WebDriverWait(driver, timeout/2).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                scroll_pane_present = True
-                break
-            except TimeoutException:
-                continue
-                
-        if not scroll_pane_present:
+        # Wait for either the feed container or older-style results, with
+        # every layout's selector checked in the same poll
+        if not wait_for(driver, CONTAINER_SEL, timeout=timeout / 2):
             logger.warning("Could not find results container")
             return False
             
         # Wait for actual results to appear
-        result_present = False
-        for selector in [RESULT_ITEMS, RESULT_LIST + ' > *', 'div.section-result']:
-            try:
-                WebDriverWait(driver, timeout/2).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                result_present = True
-                break
-            except TimeoutException:
-                continue
-                
-        if not result_present:
+        if not wait_for(driver, RESULT_WAIT_SEL, timeout=timeout / 2):
             logger.warning("No results found in container")
             return False
             
         # Additional check for "No results found" message
-        try:
-            no_results = driver.find_element(By.CSS_SELECTOR, 'div[role="status"]')
-            if "No results found" in no_results.text:
-                logger.warning("'No results found' message displayed")
-                return False
-        except NoSuchElementException:
-            pass
+        no_results = _first(driver, 'div[role="status"]')
+        if no_results and "No results found" in no_results.text:
+            logger.warning("'No results found' message displayed")
+            return False
         
         return True
         
@@ -201,18 +630,13 @@ def get_results(driver) -> List:
     """Get all result elements, handling different possible layouts."""
     results = []
     
-    # Try different possible selectors for results, from most specific to most general
-    selectors = [
-        RESULT_ITEMS,
-        RESULT_LIST + ' > *', 
-        'div.section-result',
-        'a[href^="https://www.google.com/maps/place"]'
-    ]
-    
-    for selector in selectors:
+    # Try different possible selectors for results, from most specific to most
+    # general, starting with whichever one wait_for_results saw succeed
+    for selector in _prefer_winner('result', _RESULT_SELECTORS):
         try:
             results = driver.find_elements(By.CSS_SELECTOR, selector)
             if results:
+                _winning_selector.result = selector
                 logger.info(f"Found {len(results)} results with selector: {selector}")
                 return results
         except Exception as e:
@@ -220,144 +644,111 @@ def get_results(driver) -> List:
     
     return []
 
-def extract_info_from_result(result, driver) -> Dict:
-    """Extract business information directly from the result element without clicking."""
+def _lead_from_card(card: Optional[Dict]) -> Dict:
+    """Build a lead from the field dict RESULT_CARD_JS returns for a card."""
     lead = {
         "business_name": "",
+        "address": "",
         "phone": "",
         "website": "",
         "rating": "",
         "notes": ""
     }
     
-    # Try to get all information with stale element protection
-    for attempt in range(3):  # Try up to 3 times if the element goes stale
-        try:
-            # Try to extract business name
-            try:
-                for selector in [TITLE_IN_LIST, 'div.qBF1Pd', 'span.fontHeadlineSmall', 'div.fontHeadlineSmall', 'h3']:
-                    try:
-                        name_elem = result.find_element(By.CSS_SELECTOR, selector)
-                        if name_elem and name_elem.text.strip():
-                            lead["business_name"] = name_elem.text.strip()
-                            break
-                    except (NoSuchElementException, StaleElementReferenceException):
-                        continue
-            except Exception:
-                pass
-            
-            # Try to extract rating
-            try:
-                for selector in [RATING_IN_LIST, 'span.MW4etd', 'span[aria-label*="rating"]', 'span[aria-label*="stars"]']:
-                    try:
-                        rating_elem = result.find_element(By.CSS_SELECTOR, selector)
-                        rating_text = rating_elem.text.strip() or rating_elem.get_attribute("aria-label")
-                        if rating_text:
-                            # Try to extract the numeric rating using regex
-                            rating_match = re.search(r'(\d+(\.\d+)?)(?:\s*stars?)?', rating_text)
-                            if rating_match:
-                                rating_value = rating_match.group(1)
-                                # Try to find review count nearby
-                                try:
-                                    # Try multiple selectors for review count
-                                    for review_selector in ['span.UY7F9', 'span[aria-label*="review"]']:
-                                        try:
-                                            reviews_elem = result.find_element(By.CSS_SELECTOR, review_selector)
-                                            reviews_count = reviews_elem.text.strip()
-                                            if reviews_count:
-                                                lead["rating"] = f"{rating_value} stars {reviews_count}"
-                                                break
-                                        except (NoSuchElementException, StaleElementReferenceException):
-                                            continue
-                                    # If no review count was found, just use stars
-                                    if not lead["rating"]:
-                                        lead["rating"] = f"{rating_value} stars"
-                                except Exception:
-                                    lead["rating"] = f"{rating_value} stars"
-                            else:
-                                lead["rating"] = rating_text
-                            break
-                    except (NoSuchElementException, StaleElementReferenceException):
-                        continue
-            except Exception:
-                pass
-            
-            # Extract the place URL for potential deep linking later
-            try:
-                for selector in ['a', 'a[href*="maps/place"]', 'a[data-item-id*="place"]']:
-                    try:
-                        anchor_elem = result.find_element(By.CSS_SELECTOR, selector)
-                        place_url = anchor_elem.get_attribute('href')
-                        if place_url and 'maps/place' in place_url:
-                            lead["notes"] = f"Google Maps URL: {place_url}"
-                            
-                            # Sometimes websites are directly shown in the listing
-                            if not lead.get("website") and 'website' not in place_url:
-                                # Check if we can find a website link directly in the result
-                                try:
-                                    website_link = result.find_element(By.CSS_SELECTOR, 'a[href^="http"]:not([href*="google"])')
-                                    lead["website"] = website_link.get_attribute('href')
-                                except:
-                                    pass
-                            break
-                    except (NoSuchElementException, StaleElementReferenceException):
-                        continue
-            except Exception:
-                pass
-            
-            # If we got here without a StaleElementReferenceException, break out of retry loop
-            break
-            
-        except StaleElementReferenceException:
-            if attempt < 2:  # If this is not the last attempt
-                logger.warning(f"Element went stale during extraction, retrying... (attempt {attempt + 1})")
-                random_sleep(0.5, 1.0)
-            else:
-                logger.warning("Element went stale during extraction, giving up")
+    if not card:
+        return lead
+    
+    lead["business_name"] = card.get("business_name") or ""
+    lead["address"] = card.get("address") or ""
+    
+    rating_text = card.get("rating_text")
+    if rating_text:
+        rating_match = _RATING_RE.search(rating_text)
+        if rating_match:
+            rating_value = rating_match.group(1)
+            reviews_count = card.get("reviews")
+            lead["rating"] = f"{rating_value} stars {reviews_count}" if reviews_count else f"{rating_value} stars"
+        else:
+            lead["rating"] = rating_text
+    
+    # Keep the place URL for deep linking later, see merge_listing_details
+    place_url = card.get("place_url")
+    if place_url:
+        lead["url"] = place_url
+        lead["notes"] = f"Google Maps URL: {place_url}"
+        
+        # Sometimes websites are directly shown in the listing
+        if 'website' not in place_url and card.get("website"):
+            lead["website"] = card["website"]
                 
     return lead
 
+def extract_info_from_result(result, driver) -> Dict:
+    """Extract business information directly from the result element without clicking.
+    
+    All card fields are read by RESULT_CARD_JS in a single execute_script call.
+    """
+    # A stale handle stays stale, so retrying after a sleep can't help;
+    # callers re-read the results (get_results) instead
+    card = None
+    try:
+        card = driver.execute_script(RESULT_CARD_JS, result, RESULT_CARD_SELECTORS)
+    except StaleElementReferenceException:
+        logger.warning("Element went stale during extraction, skipping it")
+    except WebDriverException as e:
+        logger.warning(f"Could not read result card: {str(e)}")
+    
+    return _lead_from_card(card)
+
+def fetch_results_via_cdp(driver) -> List[Dict]:
+    """
+    Read every result card on the page as lead dicts in one CDP call.
+    
+    Unlike get_results + extract_info_from_result, no WebElement handles
+    cross the wire; use get_results when the cards need to be clicked.
+    
+    Args:
+        driver: Chrome WebDriver instance
+        
+    Returns:
+        List of lead dicts, one per result card
+    """
+    try:
+        cards = cdp_evaluate(driver, RESULT_CARDS_EXPR) or []
+    except WebDriverException as e:
+        logger.warning(f"Could not read results via CDP: {str(e)}")
+        return []
+    
+    logger.info(f"Read {len(cards)} results via CDP")
+    return [_lead_from_card(card) for card in cards]
+
 def scroll_results_pane(driver, wait_time=3):
     """Scroll the results pane to load more results."""
     for attempt in range(3):
         try:
             # Try multiple possible scroll container selectors
-            for scroll_selector in [SCROLL_PANE, 'div[role="feed"]', 'div.section-scrollbox', '.section-layout']:
+            for scroll_selector in _SCROLL_SELECTORS:
                 try:
                     scroll_pane = wait_and_find_element(driver, scroll_selector, timeout=5)
                     if scroll_pane:
-                        # Get current scroll position and total height
-                        current_height = driver.execute_script("return arguments[0].scrollTop", scroll_pane)
-                        scroll_height = driver.execute_script("return arguments[0].scrollHeight", scroll_pane)
-                        client_height = driver.execute_script("return arguments[0].clientHeight", scroll_pane)
+                        # Scroll and wait for new cards in one round-trip; the
+                        # observer returns as soon as they render
+                        outcome = driver.execute_async_script(
+                            SCROLL_AND_WAIT_JS, scroll_pane, RESULT_ITEMS, int(wait_time * 1000), END_OF_LIST
+                        )
                         
                         # If we're already at the bottom, no need to scroll further
-                        if current_height + client_height >= scroll_height:
+                        if outcome['status'] == 'bottom':
                             logger.info("Already at the bottom of the scroll pane")
                             return False
                         
-                        # Scroll down incrementally for smoother loading
-                        target_height = current_height + min(500, client_height)
-                        
-                        # Smooth scroll with JavaScript
-                        driver.execute_script(
-                            "arguments[0].scrollTo({top: arguments[1], behavior: 'smooth'});", 
-                            scroll_pane, 
-                            target_height
-                        )
-                        
-                        logger.info(f"Scrolled down results pane from {current_height} to {target_height}")
+                        logger.info(f"Scrolled down results pane from {outcome['from']} to {outcome['to']}")
+                        if outcome['status'] == 'loaded':
+                            logger.info("New results loaded")
+                        elif outcome['status'] == 'end':
+                            logger.info("Reached the end of the results list")
                         
-                        # Wait for new results to load with progressive waiting
-                        for i in range(3):
-                            time.sleep(wait_time / 3)
-                            # Check if new content has loaded by comparing heights
-                            new_scroll_height = driver.execute_script("return arguments[0].scrollHeight", scroll_pane)
-                            if new_scroll_height > scroll_height:
-                                logger.info(f"New content loaded, scroll height increased from {scroll_height} to {new_scroll_height}")
-                                return True
-                        
-                        # Even if height didn't change, consider it successful since we scrolled
+                        # Even if nothing new rendered, consider it successful since we scrolled
                         return True
                 except (StaleElementReferenceException, NoSuchElementException) as e:
                     if attempt == 2:  # Last attempt
@@ -367,8 +758,14 @@ def scroll_results_pane(driver, wait_time=3):
             # If we get here, none of the selectors worked - fallback to body scroll
             try:
                 logger.info("Falling back to body scroll")
+                before = driver.execute_script(COUNT_JS, RESULT_ITEMS)
                 driver.execute_script("window.scrollBy(0, 500);")
-                time.sleep(wait_time)
+                try:
+                    WebDriverWait(driver, wait_time, poll_frequency=0.2).until(
+                        lambda d: d.execute_script(COUNT_JS, RESULT_ITEMS) > before
+                    )
+                except TimeoutException:
+                    pass
                 return True
             except Exception as body_e:
                 logger.debug(f"Body scroll fallback failed: {body_e}")
@@ -376,17 +773,38 @@ def scroll_results_pane(driver, wait_time=3):
         except StaleElementReferenceException:
             if attempt < 2:
                 logger.warning(f"Scroll pane went stale, retrying... (attempt {attempt + 1})")
-                time.sleep(1)
             else:
                 logger.warning("Scroll pane went stale after multiple attempts")
         except Exception as e:
             logger.error(f"Failed to scroll results pane: {e}")
             if attempt < 2:
-                time.sleep(1)
+                _wait_ready(driver, max_ms=1000)
             
     return False
 
 # New generic extractor function
+def parse_data_items(items: Optional[List[Dict]]) -> Dict:
+    """
+    Map harvested data-item-id entries to their href (links) or text.
+    
+    Args:
+        items: Entries returned by DATA_ITEMS_JS
+        
+    Returns:
+        Dictionary mapping item_ids to values
+    """
+    data = {}
+    for item in items or []:
+        key = item['id']  # e.g. "address", "phone:tel:09823...", "authority"
+
+        # Links carry their value in the href; many others are buttons
+        # whose visible value lives in a child <div class="Io6YTe">
+        if item['tag'] == 'a' and item['href']:
+            data[key] = item['href'].strip()
+        else:
+            data[key] = (item['text'] or '').strip()
+    return data
+
 def generic_parse_details(driver) -> Dict:
     """
     After clicking a listing and waiting for its details pane to load,
@@ -396,56 +814,23 @@ def generic_parse_details(driver) -> Dict:
       • EVERY element carrying a `data-item-id` attribute
     It returns a dict mapping item_ids → their text or href (if link).
     """
+    # Name, rating and every data-item-id entry in a single script round-trip
+    fields = driver.execute_script(EXTRACT_JS, DETAILS_FIELD_SELECTORS) or {}
     data = {}
 
-    # 1. Business name (always inside the <h1> span)
-    try:
-        name_el = driver.find_element(By.CSS_SELECTOR, 'h1.DUwDvf span, h1.DUwDvf.lfPIob span, h1.fontHeadlineLarge')
-        data['business_name'] = name_el.text.strip()
-    except NoSuchElementException:
-        # Try alternate selectors for business name
-        try:
-            name_el = driver.find_element(By.CSS_SELECTOR, 'h1, h1.fontHeadlineLarge, h2.fontHeadlineLarge, div.fontHeadlineLarge')
-            data['business_name'] = name_el.text.strip()
-        except NoSuchElementException:
-            data['business_name'] = ''
-            logger.warning("Could not find business name")
+    # 1. Business name (always inside the <h1> span), with alternate selectors
+    data['business_name'] = (fields.get('name') or '').strip()
+    if not data['business_name']:
+        logger.warning("Could not find business name")
 
-    # 2. Rating (if present)
-    try:
-        rating_el = driver.find_element(By.CSS_SELECTOR, 'div.F7nice span[aria-hidden="true"]')
-        data['rating'] = rating_el.text.strip()
-        
-        # Try to get review count if available
-        try:
-            reviews_el = driver.find_element(By.CSS_SELECTOR, 'span.UY7F9, button.fontTitleSmall span')
-            reviews_count = reviews_el.text.strip()
-            if reviews_count:
-                data['rating'] = f"{data['rating']} stars ({reviews_count})"
-        except NoSuchElementException:
-            pass
-            
-    except NoSuchElementException:
-        data['rating'] = ''
+    # 2. Rating (if present), with the review count when available
+    data['rating'] = (fields.get('rating') or '').strip()
+    reviews_count = (fields.get('reviews') or '').strip()
+    if data['rating'] and reviews_count:
+        data['rating'] = f"{data['rating']} stars ({reviews_count})"
 
     # 3. All data-item-id entries
-    elems = driver.find_elements(By.CSS_SELECTOR, '[data-item-id]')
-    for el in elems:
-        item_id = el.get_attribute('data-item-id')  # e.g. "address", "phone:tel:09823...", "authority"
-        key = item_id
-
-        # Try to pull an href if it's a link
-        if el.tag_name.lower() == 'a':
-            href = el.get_attribute('href')
-            data[key] = href.strip() if href else el.text.strip()
-        else:
-            # Many are buttons; their visible value often lives in a child <div class="Io6YTe">
-            try:
-                val = el.find_element(By.CSS_SELECTOR, 'div.Io6YTe').text.strip()
-            except NoSuchElementException:
-                # fallback to the element's own text
-                val = el.text.strip()
-            data[key] = val
+    data.update(parse_data_items(fields.get('items')))
 
     logger.info(f"Extracted data using generic parser: {data}")
     return data
@@ -468,17 +853,26 @@ def normalize_lead_data(lead: Dict) -> Dict:
         'notes': ''
     }
     
+    # Sort the raw keys into buckets in a single pass over the dict
+    name_candidate = ''
+    phone_key = None
+    order_links = []
+    for key, value in lead.items():
+        if key.startswith('phone:tel:'):
+            if phone_key is None:
+                phone_key = key
+        elif key.startswith('action:4'):
+            if value:
+                order_links.append(value)
+        elif not name_candidate and value and _NAME_KEY_RE.search(key):
+            name_candidate = value
+
     # Extract business name - try multiple approaches
     if lead.get('business_name'):
         normalized['business_name'] = lead['business_name']
     else:
         # Try to find business name in other fields
-        name_indicators = ['name:', 'place_name:', 'title:', 'heading:']
-        for key in lead:
-            if any(indicator in key.lower() for indicator in name_indicators):
-                if lead[key]:
-                    normalized['business_name'] = lead[key]
-                    break
+        normalized['business_name'] = name_candidate
         
         # If still no name, try to extract from URL or menu link
         if not normalized['business_name']:
@@ -492,14 +886,13 @@ def normalize_lead_data(lead: Dict) -> Dict:
                     if '.com' in domain:
                         domain = domain.split('.com')[0]
                     if domain and not any(x in domain.lower() for x in ['google', 'maps']):
-                        normalized['business_name'] = domain.replace('-', ' ').replace('.', ' ').title()
+                        normalized['business_name'] = domain.translate(_DOMAIN_SEP_TABLE).title()
                         break
     
     # Extract phone (look for phone:tel: prefix)
-    phone_keys = [k for k in lead if k.startswith('phone:tel:')]
-    if phone_keys:
+    if phone_key:
         # Get the number from the value if present, otherwise from the key
-        phone = lead[phone_keys[0]] if lead[phone_keys[0]] else phone_keys[0].replace('phone:tel:', '')
+        phone = lead[phone_key] or phone_key[len('phone:tel:'):]
         normalized['phone'] = phone  # Keep phone number exactly as found
     
     # Extract website
@@ -520,9 +913,8 @@ def normalize_lead_data(lead: Dict) -> Dict:
         notes.append(f"Menu: {lead['menu']}")
     
     # Add order links
-    for key in lead:
-        if key.startswith('action:4') and lead[key]:
-            notes.append(f"Order: {lead[key]}")
+    for link in order_links:
+        notes.append(f"Order: {link}")
     
     # Add business hours if available
     if 'oh' in lead and lead['oh']:
@@ -551,12 +943,102 @@ def extract_data_from_side_panel(driver) -> Dict:
     logger.info(f"Extracted detailed lead information: {lead}")
     return lead
 
+def _dedup_key(lead: Dict) -> tuple:
+    """Return the (stripped lowercased name, phone digits) pair leads are deduplicated on."""
+    return (
+        (lead.get('business_name') or '').strip().lower(),
+        _NON_DIGIT_RE.sub('', lead.get('phone') or '')
+    )
+
+def _address_words(lead: Dict) -> frozenset:
+    """Return the lead's lowercased address words."""
+    return frozenset((lead.get('address') or '').lower().split())
+
+class LeadIndex:
+    """In-memory hash index of seen names and phones for O(1) duplicate checks.
+    
+    Optionally also treats leads whose addresses share enough words as
+    duplicates; address word sets are computed once per lead, and an
+    inverted word index limits comparisons to addresses sharing a word.
+    """
+    
+    def __init__(self, leads: Optional[List[Dict]] = None, address_threshold: Optional[float] = None):
+        """
+        Build the index, seeding it with any existing leads.
+        
+        Args:
+            leads: Leads already collected
+            address_threshold: Share of address words two leads must have in
+                common to count as duplicates (e.g. 0.7); None disables the check
+        """
+        self.seen_names: Set[str] = set()
+        self.seen_phones: Set[str] = set()
+        self.address_threshold = address_threshold
+        self._address_words: Dict[str, List[frozenset]] = {}
+        for lead in leads or ():
+            self.add(lead)
+    
+    def _similar_address(self, words: frozenset) -> bool:
+        """Return True if an indexed address overlaps words past the threshold."""
+        checked = set()
+        for word in words:
+            for other in self._address_words.get(word, ()):
+                if other in checked:
+                    continue
+                checked.add(other)
+                if len(words & other) / max(len(words), len(other)) > self.address_threshold:
+                    return True
+        return False
+    
+    def _seen(self, name: str, phone: str, words: Optional[frozenset]) -> bool:
+        """Return True if the normalized keys match an indexed lead."""
+        if (name and name in self.seen_names) or (phone and phone in self.seen_phones):
+            return True
+        return bool(words) and self._similar_address(words)
+    
+    def _keys(self, lead: Dict) -> tuple:
+        """Normalize a lead once into (name, phone, address words or None)."""
+        name, phone = _dedup_key(lead)
+        words = _address_words(lead) if self.address_threshold is not None else None
+        return name, phone, words
+    
+    def __contains__(self, lead: Dict) -> bool:
+        """Return True if lead shares a name, phone or similar address with an indexed lead."""
+        return self._seen(*self._keys(lead))
+    
+    def add(self, lead: Dict) -> bool:
+        """
+        Index a lead unless it duplicates an indexed one.
+        
+        The normalized keys are kept in the index only; the lead dict
+        itself is left untouched.
+        
+        Args:
+            lead: Lead dictionary to index
+            
+        Returns:
+            True if the lead was indexed, False if it was a duplicate
+        """
+        name, phone, words = self._keys(lead)
+        if self._seen(name, phone, words):
+            return False
+        if name:
+            self.seen_names.add(name)
+        if phone:
+            self.seen_phones.add(phone)
+        if words:
+            for word in words:
+                self._address_words.setdefault(word, []).append(words)
+        return True
+
 def is_duplicate_lead(leads, new_lead):
     """
     Check if a lead is a duplicate based on business name or phone number.
     
     Args:
-        leads: List of existing leads
+        leads: Existing leads, as a list or a LeadIndex; pass a LeadIndex
+            kept up to date across calls for constant-time checks, since a
+            list is scanned on every call
         new_lead: New lead to check
     
     Returns:
@@ -566,19 +1048,78 @@ def is_duplicate_lead(leads, new_lead):
     if not new_lead.get('business_name') and not new_lead.get('phone'):
         return False
     
+    if isinstance(leads, LeadIndex):
+        return new_lead in leads
+    
+    # Every listed lead is compared, even ones that duplicate each other
+    name, phone = _dedup_key(new_lead)
     for lead in leads:
-        # If both business names exist and match
-        if (new_lead.get('business_name') and lead.get('business_name') and 
-            new_lead['business_name'].lower() == lead['business_name'].lower()):
+        lead_name, lead_phone = _dedup_key(lead)
+        if (name and name == lead_name) or (phone and phone == lead_phone):
             return True
+    return False
+
+class LeadStore:
+    """Append-only SQLite store that drops duplicate leads on insert.
+    
+    Each store gets its own temporary database file, so concurrent runs
+    (two app sessions, or the CLI next to the app) never see or clear
+    each other's leads. The file is deleted on close.
+    """
+    
+    def __init__(self):
+        """Create an empty store in a private temporary database."""
+        fd, self.db_path = tempfile.mkstemp(prefix='leads-', suffix='.db')
+        os.close(fd)
+        # A generator holding the store may be resumed or closed elsewhere
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # Throwaway file: nothing to recover after a crash
+        self.conn.execute("PRAGMA journal_mode=OFF")
+        self.conn.execute("PRAGMA synchronous=OFF")
+        self.conn.execute(
+            "CREATE TABLE leads("
+            "id INTEGER PRIMARY KEY, name_lc TEXT, phone_digits TEXT, json TEXT)"
+        )
+        # A lead is a duplicate if either its name or its phone was seen
+        self.conn.execute(
+            "CREATE UNIQUE INDEX leads_name "
+            "ON leads(name_lc) WHERE name_lc != ''"
+        )
+        self.conn.execute(
+            "CREATE UNIQUE INDEX leads_phone "
+            "ON leads(phone_digits) WHERE phone_digits != ''"
+        )
+    
+    def add(self, lead: Dict) -> bool:
+        """
+        Insert a lead unless it duplicates a stored one.
+        
+        Args:
+            lead: Lead dictionary to store
             
-        # If phone numbers match (comparing only digits)
-        if (new_lead.get('phone') and lead.get('phone') and
-            ''.join(filter(str.isdigit, new_lead['phone'])) == 
-            ''.join(filter(str.isdigit, lead['phone']))):
-            return True
+        Returns:
+            True if the lead was stored, False if it was a duplicate
+        """
+        name_lc, phone_digits = _dedup_key(lead)
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO leads(name_lc, phone_digits, json) VALUES(?, ?, ?)",
+            (name_lc, phone_digits, json.dumps(lead))
+        )
+        # No commit per insert; this connection is the only reader
+        return cursor.rowcount > 0
     
-    return False
+    def leads(self) -> List[Dict]:
+        """Return the stored leads in insertion order."""
+        rows = self.conn.execute("SELECT json FROM leads ORDER BY id")
+        return [json.loads(row[0]) for row in rows]
+    
+    def close(self) -> None:
+        """Close the database connection and delete its file."""
+        self.conn.close()
+        try:
+            os.remove(self.db_path)
+        except OSError as e:
+            logger.warning(f"Could not remove lead store {self.db_path}: {e}")
 
 def extract_listing_urls(driver, limit: int) -> List[str]:
     """
@@ -591,84 +1132,24 @@ def extract_listing_urls(driver, limit: int) -> List[str]:
     Returns:
         List of Google Maps listing URLs
     """
-    listing_urls = []
     try:
-        # Try multiple selectors for result containers
-        selectors = [
-            '[role="article"]',  # New layout
-            'div.Nv2PK',        # Alternative layout
-            'a[href*="/place/"]',  # Direct place links
-            'div.bfdHYd'        # Older layout
-        ]
-        
-        results = []
-        for selector in selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    logger.info(f"Found {len(elements)} elements with selector: {selector}")
-                    results = elements
-                    break
-            except Exception as e:
-                logger.debug(f"Selector {selector} failed: {str(e)}")
-        
-        if not results:
+        # Every container's URL is read in one script call rather than a
+        # handful of WebDriver commands per result
+        harvest = driver.execute_script(LISTING_URLS_JS, _URL_CONTAINER_SELECTORS, limit)
+        if not harvest:
             logger.error("No results found with any selector")
             return []
-            
-        # Extract URLs from results
-        for result in results[:limit]:
-            try:
-                # Try different methods to get the URL
-                url = None
-                
-                # Method 1: Direct href if the element is an anchor
-                if result.tag_name == 'a':
-                    url = result.get_attribute('href')
-                    logger.debug(f"Method 1 - Direct href: {url}")
-                
-                # Method 2: Find anchor within the element
-                if not url:
-                    anchors = result.find_elements(By.CSS_SELECTOR, 'a[href*="/place/"]')
-                    if anchors:
-                        url = anchors[0].get_attribute('href')
-                        logger.debug(f"Method 2 - Inner anchor: {url}")
-                
-                # Method 3: Find any anchor and check href
-                if not url:
-                    all_anchors = result.find_elements(By.TAG_NAME, 'a')
-                    for anchor in all_anchors:
-                        href = anchor.get_attribute('href')
-                        if href and '/place/' in href:
-                            url = href
-                            logger.debug(f"Method 3 - Any anchor with place: {url}")
-                            break
-                
-                # Method 4: Try to get data attribute if available
-                if not url:
-                    place_id = result.get_attribute('data-place-id')
-                    if place_id:
-                        url = f"https://www.google.com/maps/place/?q=place_id:{place_id}"
-                        logger.debug(f"Method 4 - Place ID: {url}")
-                
-                # Validate and add URL
-                if url and '/place/' in url:
-                    listing_urls.append(url)
-                    logger.debug(f"Added URL: {url}")
-                else:
-                    logger.debug(f"Invalid or missing URL for result {len(listing_urls) + 1}")
-                
-            except Exception as e:
-                logger.warning(f"Failed to extract URL from result: {str(e)}")
-                continue
+        
+        listing_urls = harvest['urls']
+        logger.info(f"Found {harvest['count']} elements with selector: {harvest['selector']}")
         
         # Log summary
-        logger.info(f"Successfully extracted {len(listing_urls)} URLs from {len(results)} results")
+        logger.info(f"Successfully extracted {len(listing_urls)} URLs from {harvest['count']} results")
         
         # If we found no URLs but had results, dump HTML for debugging
-        if not listing_urls and results:
+        if not listing_urls:
             logger.debug("No URLs extracted. First result HTML:")
-            logger.debug(results[0].get_attribute('outerHTML'))
+            logger.debug(harvest['firstHtml'])
         
         return listing_urls
         
@@ -676,124 +1157,303 @@ def extract_listing_urls(driver, limit: int) -> List[str]:
         logger.error(f"Error extracting listing URLs: {str(e)}")
         return []
 
-def scrape_single_listing(url: str) -> Dict:
+@contextmanager
+def _rate_limited() -> Iterator[None]:
     """
-    Scrape a single Google Maps listing using its URL.
+    Gate one listing on the shared concurrency, spacing and rate limits.
+    
+    Holds a concurrency token, waits for this thread's load slot, then
+    takes one LIMITER token. Slots are spaced by a random MAPS_MIN_DELAY..MAPS_MAX_DELAY interval
+    across all worker threads; LIMITER caps the sustained rate at
+    MAPS_RATE_CALLS per MAPS_RATE_PERIOD. A listing takes a single token
+    however many pages (HTTP, then browser) it loads.
+    """
+    global _rate_next_slot
+    
+    with _rate_tokens:
+        with _rate_lock:
+            now = time.monotonic()
+            slot = max(now, _rate_next_slot)
+            _rate_next_slot = slot + random.uniform(MAPS_MIN_DELAY, MAPS_MAX_DELAY)
+        time.sleep(max(0, slot - now))
+        with LIMITER:
+            yield
+
+def _lock_profile_file(path: str) -> Optional[IO]:
+    """
+    Take a non-blocking exclusive lock on path, or return None if it's held.
+    
+    Raises:
+        OSError: If the file can't be locked at all, e.g. ENOLCK on NFS
+    """
+    handle = open(path, 'a+')
+    try:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError as e:
+        handle.close()
+        if e.errno in _LOCK_HELD_ERRNOS:
+            return None
+        raise
+    return handle
+
+def _claim_profile_slot() -> Optional[int]:
+    """
+    Reserve the lowest profile slot no running listing driver is using.
+    
+    Slots are also locked on disk, so concurrent scraper processes (the
+    CLI next to the app, or two app sessions) never share a profile.
     
-    Args:
-        url: Google Maps listing URL
-        
     Returns:
-        Dictionary containing extracted business information
+        The slot, or None when all CHROME_PROFILE_SLOTS are taken or the
+        profile directory can't be locked; the driver then needs a
+        throwaway profile
     """
-    driver = None
-    data = {
-        'url': url,
-        'business_name': '',
-        'phone': '',
-        'website': '',
-        'rating': '',
-        'notes': ''
-    }
+    os.makedirs(CHROME_PROFILE_ROOT, exist_ok=True)
+    with _profile_lock:
+        for slot in range(CHROME_PROFILE_SLOTS):
+            if slot in _profiles_in_use:
+                continue
+            lock_path = os.path.join(CHROME_PROFILE_ROOT, f'chrome-profile-{slot}.lock')
+            try:
+                handle = _lock_profile_file(lock_path)
+            except OSError as e:
+                logger.warning(f"Could not lock Chrome profiles in {CHROME_PROFILE_ROOT}: {str(e)}")
+                return None
+            if handle is not None:
+                _profiles_in_use[slot] = handle
+                return slot
     
+    logger.warning(f"All {CHROME_PROFILE_SLOTS} Chrome profile slots are in use")
+    return None
+
+def _release_profile_slot(slot: Optional[int]) -> None:
+    """Make a profile slot available to the next listing driver."""
+    with _profile_lock:
+        handle = _profiles_in_use.pop(slot, None)
+    if handle is None:
+        return
     try:
-        # Initialize Chrome with visible window
-        options = webdriver.ChromeOptions()
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-gpu')
-        options.add_argument(f'user-agent={random.choice(USER_AGENTS)}')
-        
-        service = webdriver.ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-        
-        driver.set_page_load_timeout(20)
+        if fcntl is None:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+    finally:
+        # Closing the file drops the flock
+        handle.close()
+
+def block_urls(driver, patterns) -> None:
+    """
+    Have Chrome abort requests matching any of patterns, via CDP.
+    
+    The HTTP cache stays enabled so scripts loaded once are reused.
+    
+    Args:
+        driver: Chrome WebDriver instance
+        patterns: URL wildcard patterns, e.g. "*.png"
+    """
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+    driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+
+def create_listing_driver() -> webdriver.Chrome:
+    """Build a lean headless Chrome for reading listing detail pages."""
+    # Chrome locks its profile, so each live driver gets its own slot, or
+    # a cold throwaway profile when no slot is free
+    slot = _claim_profile_slot()
+    if slot is None:
+        profile_dir = tempfile.mkdtemp(prefix='chrome-profile-')
+    else:
+        profile_dir = os.path.join(CHROME_PROFILE_ROOT, f'chrome-profile-{slot}')
+    
+    # The worker never renders frames, so strip everything it won't read
+    options = webdriver.ChromeOptions()
+    options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--disable-background-networking')
+    options.add_argument('--disable-sync')
+    options.add_argument('--disable-default-apps')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_argument(f'user-agent={random.choice(USER_AGENTS)}')
+    options.add_argument(f'--user-data-dir={profile_dir}')
+    options.add_argument(f'--disk-cache-size={CHROME_DISK_CACHE_BYTES}')
+    # Return from driver.get at DOMContentLoaded instead of full load
+    options.page_load_strategy = 'eager'
+    
+    try:
+        service = Service(chromedriver_path())
+        driver = webdriver.Chrome(service=service, options=options)
+    except Exception:
+        _release_profile_slot(slot)
+        if slot is None:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+        raise
+    driver.profile_slot = slot
+    driver.profile_dir = profile_dir
+    
+    try:
+        driver.set_page_load_timeout(20)
+        driver.implicitly_wait(0)  # Explicit waits only; no hidden double polling
+        
+        # Drop images, stylesheets, fonts and trackers before they hit the wire
+        block_urls(driver, BLOCKED_URL_PATTERNS)
+    except Exception:
+        quit_listing_driver(driver)
+        raise
+    return driver
+
+def quit_listing_driver(driver: webdriver.Chrome) -> None:
+    """Quit a listing driver and free its profile slot."""
+    try:
+        driver.quit()
+    finally:
+        slot = getattr(driver, 'profile_slot', None)
+        _release_profile_slot(slot)
+        if slot is None and getattr(driver, 'profile_dir', None):
+            shutil.rmtree(driver.profile_dir, ignore_errors=True)
+
+@contextmanager
+def _listing_driver(pool: Optional[DriverPool]) -> Iterator[webdriver.Chrome]:
+    """Borrow a driver from pool, or run a throwaway one when pool is None."""
+    if pool is not None:
+        with pool.acquire() as driver:
+            yield driver
+        return
+    
+    driver = create_listing_driver()
+    try:
+        yield driver
+    finally:
+        quit_listing_driver(driver)
+
+def scrape_single_listing(url: str, pool: Optional[DriverPool] = None) -> Optional[Dict]:
+    """
+    Scrape a single Google Maps listing, honouring the shared rate limit.
+    
+    Args:
+        url: Google Maps listing URL
+        pool: Optional driver pool to borrow a browser from; a fresh
+            browser is launched and quit when omitted
+        
+    Returns:
+        Dictionary containing extracted business information, or None
+    """
+    try:
+        with _rate_limited():
+            # Plain HTTP first; a browser only when the page needs rendering
+            lead = fetch_listing_http(url)
+            if lead:
+                return lead
+            with _listing_driver(pool) as driver:
+                return _scrape_listing(url, driver)
+    except Exception as e:
+        logger.error(f"Error scraping listing {url}: {str(e)}")
+        return None
+
+# WebDriver errors caused by the page rather than a broken browser
+_PAGE_ERRORS = (
+    TimeoutException,
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+
+def _scrape_listing(url: str, driver: webdriver.Chrome) -> Optional[Dict]:
+    """
+    Scrape a single Google Maps listing using its URL.
+    
+    Args:
+        url: Google Maps listing URL
+        driver: WebDriver to load the listing in
         
+    Returns:
+        Dictionary containing extracted business information
+    """
+    data = {
+        'url': url,
+        'business_name': '',
+        'phone': '',
+        'website': '',
+        'rating': '',
+        'notes': ''
+    }
+    
+    try:
         # Load the listing URL
         driver.get(url)
-        time.sleep(random.uniform(1, 2))
         
         try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "h1.DUwDvf"))
-            )
+            WebDriverWait(driver, 10, poll_frequency=0.1).until(LISTING_TITLE_COND)
             
-            # Extract business name
-            try:
-                name = driver.find_element(By.CSS_SELECTOR, "h1.DUwDvf").text
-                data['business_name'] = name
-            except: 
-                pass
-                
-            # Extract rating and review count
-            try:
-                rating = driver.find_element(By.CSS_SELECTOR, ".F7nice span[aria-hidden='true']").text
-                if rating:
-                    data['rating'] = rating
-                    # Get review count
-                    try:
-                        reviews_elem = driver.find_element(By.CSS_SELECTOR, 'span[aria-label*="reviews"]')
-                        review_count = reviews_elem.text.strip().replace("(", "").replace(")", "")
-                        if review_count:
-                            data['rating'] = f"{rating} ({review_count} reviews)"
-                    except NoSuchElementException:
-                        pass
-            except: 
-                pass
-                
-            # Extract phone number (keeping original format)
-            try:
-                phone = driver.find_element(By.CSS_SELECTOR, 'button[data-item-id^="phone:tel:"] div').text
-                if phone != "-":
-                    data['phone'] = phone
-            except: 
-                pass
-                
-            # Extract website
+            # The details are in the DOM; abort lingering tile/ad requests
             try:
-                website = driver.find_element(By.CSS_SELECTOR, 'a[data-item-id="authority"]').get_attribute("href")
-                if website:
-                    data['website'] = website
-            except: 
-                pass
+                driver.execute_cdp_cmd("Page.stopLoading", {})
+            except WebDriverException as e:
+                logger.debug(f"Could not stop page loading: {str(e)}")
                 
-            logger.info(f"Extracted data with reliable selectors for {data['business_name']}")
-                    
         except TimeoutException:
             logger.warning(f"Timeout waiting for content to load for {url}")
         
-        # Use comprehensive generic parser
-        raw_data = generic_parse_details(driver)
+        # The page state holds the whole place; the DOM is only read without it
+        try:
+            lead = parse_app_state(cdp_evaluate(driver, APP_STATE_EXPR))
+        except JavascriptException as e:
+            logger.debug(f"Could not read page state for {url}: {str(e)}")
+            lead = None
+        if lead:
+            lead['url'] = url
+            logger.info(f"Extracted data from page state for {lead['business_name']}")
+            return lead
+        
+        # Read every listing field in one script round-trip
+        fields = cdp_evaluate(driver, EXTRACT_EXPR) or {}
+        data['business_name'] = fields.get('name') or ''
+        
+        rating = fields.get('rating')
+        if rating:
+            data['rating'] = rating
+            review_count = (fields.get('reviews') or '').strip().translate(_PAREN_TABLE)
+            if review_count:
+                data['rating'] = f"{rating} ({review_count} reviews)"
+        
+        # Keep the phone number in its original format
+        phone = fields.get('phone')
+        if phone and phone != "-":
+            data['phone'] = phone
+        
+        if fields.get('website'):
+            data['website'] = fields['website']
+        
+        logger.info(f"Extracted data with reliable selectors for {data['business_name']}")
+        
+        # Generic data-item-id entries came back in the same call
+        raw_data = {
+            'business_name': (fields.get('fallbackName') or '').strip(),
+            'rating': ''
+        }
+        raw_data.update(parse_data_items(fields.get('items')))
         
         # Normalize the data using our existing function
         normalized_data = normalize_lead_data(raw_data)
         
-        # Update our data dictionary with any missing values from normalized data
-        for key in normalized_data:
-            if not data.get(key) and normalized_data.get(key):
-                data[key] = normalized_data[key]
-        
-        # Additional social links extraction
-        social_links = []
-        try:
-            links = driver.find_elements(By.CSS_SELECTOR, 'a[data-item-id*="social"]')
-            for link in links:
-                href = link.get_attribute('href')
-                if href:
-                    social_links.append(href)
-        except: pass
+        # Fill fields the listing extraction left empty from normalized data
+        data = {**data, **normalized_data, **{k: v for k, v in data.items() if v}}
         
+        # Social links and business hours came back with the listing fields
+        social_links = [href for href in fields.get('socials') or [] if href]
         if social_links:
             note = f"Social links: {', '.join(social_links)}"
             data['notes'] = note if not data.get('notes') else f"{data['notes']} | {note}"
         
-        # Extract business hours if available
-        try:
-            hours_button = driver.find_element(By.CSS_SELECTOR, 'button[data-item-id*="oh"]')
-            hours_text = hours_button.text
-            if hours_text and 'hours' in hours_text.lower():
-                note = f"Hours: {hours_text}"
-                data['notes'] = note if not data.get('notes') else f"{data['notes']} | {note}"
-        except: pass
+        hours_text = fields.get('hours')
+        if hours_text and 'hours' in hours_text.lower():
+            note = f"Hours: {hours_text}"
+            data['notes'] = note if not data.get('notes') else f"{data['notes']} | {note}"
         
         # Skip entries with no business name
         if not data['business_name']:
@@ -803,71 +1463,518 @@ def scrape_single_listing(url: str) -> Dict:
         logger.info(f"Successfully extracted data for {data.get('business_name')}")
         return data
         
+    except _PAGE_ERRORS as e:
+        # A slow or odd page; the browser itself is fine
+        logger.error(f"Error scraping listing {url}: {str(e)}")
+        return None
+    except WebDriverException:
+        # A dead session or browser (InvalidSessionIdException, a crashed
+        # tab); let the pool recycle it
+        raise
     except Exception as e:
         logger.error(f"Error scraping listing {url}: {str(e)}")
         return None
-    
-    finally:
-        if driver:
-            driver.quit()
 
-def scrape_listings_parallel(urls: List[str], max_workers: int = 10) -> List[Dict]:
+def scrape_listings_parallel(urls: List[str], max_workers: int = 10) -> Iterator[Dict]:
     """
-    Scrape multiple listings in parallel using ProcessPoolExecutor.
+    Scrape multiple listings in parallel on a pool of reused browsers.
     
     Args:
         urls: List of Google Maps listing URLs
-        max_workers: Maximum number of parallel processes (default 10)
+        max_workers: Maximum number of worker threads (default 10)
         
-    Returns:
-        List of dictionaries containing business information
+    Yields:
+        Dictionaries containing business information, as each completes
     """
-    results = []
     total_urls = len(urls)
     processed = 0
-    seen_urls = set()  # Track unique URLs
-    unique_urls = []
     
-    # Ensure unique URLs only
-    for url in urls:
-        if url not in seen_urls:
-            seen_urls.add(url)
-            unique_urls.append(url)
+    # Ensure unique URLs only, keeping their original order
+    unique_urls = list(dict.fromkeys(urls))
     
     logger.info(f"Found {len(unique_urls)} unique URLs out of {total_urls} total URLs")
     total_urls = len(unique_urls)
     
     logger.info(f"Starting parallel processing of {total_urls} URLs with {max_workers} workers")
     
-    # Split URLs into smaller batches
-    batch_size = min(10, total_urls)  # Increased batch size to match worker count
-    url_batches = [unique_urls[i:i + batch_size] for i in range(0, len(unique_urls), batch_size)]
+    pool = DriverPool(create_listing_driver, teardown=quit_listing_driver)
+    store = LeadStore()
     
-    for batch in url_batches:
-        with ProcessPoolExecutor(max_workers=min(max_workers, len(batch))) as executor:
-            # Submit batch of URLs to the process pool
-            future_to_url = {executor.submit(scrape_single_listing, url): url for url in batch}
+    try:
+        # One executor for the whole run; pacing between page loads comes
+        # from _rate_limited in scrape_single_listing
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total_urls))) as executor:
+            # Each worker thread reuses a pooled browser
+            future_to_url = {executor.submit(scrape_single_listing, url, pool): url for url in unique_urls}
             
-            # Collect results as they complete
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
+            try:
+                # Collect results as they complete
+                for future in as_completed(future_to_url):
+                    url = future_to_url[future]
+                    try:
+                        result = future.result()
+                        name = result.get('business_name') if result else None
+                        if not name:
+                            logger.warning(f"Skipping invalid result for URL: {url}")
+                        elif store.add(result):
+                            processed += 1
+                            # Lazy %-formatting: nothing is built when INFO is off
+                            logger.info("Processed %d/%d: %s", processed, total_urls, name)
+                            yield result
+                        else:
+                            logger.info("Skipping duplicate lead: %s", name)
+                    except Exception as e:
+                        logger.error(f"Error processing {url}: {str(e)}")
+            finally:
+                # A consumer that stops early (it has enough leads) shouldn't
+                # wait for the listings still queued behind it
+                for future in future_to_url:
+                    future.cancel()
+    finally:
+        store.close()
+        pool.close()
+    
+    logger.info(f"Parallel processing complete. Processed {processed} valid results from {total_urls} URLs")
+
+def _dig(data, *path):
+    """Follow path of indexes into nested lists, returning None if any step is missing."""
+    for index in path:
+        try:
+            data = data[index]
+        except (IndexError, KeyError, TypeError):
+            return None
+    return data
+
+def _load_xssi_json(text: str):
+    """Decode JSON that may sit behind Google's XSSI prefix."""
+    text = text.strip()
+    if text.startswith(_XSSI_PREFIX):
+        text = text[len(_XSSI_PREFIX):]
+    return json.loads(text)
+
+def _lead_from_place(place) -> Optional[Dict]:
+    """Build a lead from a positional Maps place array, or None without a name."""
+    name = _dig(place, 11)
+    if not isinstance(place, list) or not name:
+        return None
+    
+    raw_data = {'business_name': name, 'rating': ''}
+    rating, review_count = _dig(place, 4, 7), _dig(place, 4, 8)
+    if rating:
+        raw_data['rating'] = f"{rating} ({review_count} reviews)" if review_count else str(rating)
+    phone = _dig(place, 178, 0, 0)
+    if phone:
+        raw_data[f'phone:tel:{phone}'] = phone
+    website = _dig(place, 7, 0)
+    if website:
+        raw_data['authority'] = website
+    
+    lead = normalize_lead_data(raw_data)
+    lead['address'] = _dig(place, 39) or ''
+    place_id = _dig(place, 78)
+    if place_id:
+        lead['url'] = f"https://www.google.com/maps/place/?q=place_id:{place_id}"
+    return lead
+
+def parse_search_response(body: str) -> List[Dict]:
+    """
+    Turn the body of a Maps search XHR into normalized leads.
+    
+    The payload is positional JSON behind an XSSI prefix, sometimes wrapped
+    in a {"d": ...} envelope; places sit at index 14 of each result entry.
+    
+    Args:
+        body: Raw response body
+        
+    Returns:
+        List of lead dictionaries, empty if the body can't be parsed
+    """
+    try:
+        data = _load_xssi_json(body)
+        if isinstance(data, dict) and isinstance(data.get('d'), str):
+            return parse_search_response(data['d'])
+    except json.JSONDecodeError as e:
+        logger.debug(f"Could not decode search response: {str(e)}")
+        return []
+    
+    leads = []
+    for entry in _dig(data, 0, 1) or []:
+        lead = _lead_from_place(_dig(entry, 14))
+        if lead:
+            leads.append(lead)
+    return leads
+
+def parse_place_page(html: str) -> Optional[Dict]:
+    """
+    Read a lead from the APP_INITIALIZATION_STATE embedded in a place page.
+    
+    Args:
+        html: Raw HTML of a /maps/place/ page
+        
+    Returns:
+        Lead dictionary, or None if the page carries no place data
+    """
+    match = _APP_STATE_RE.search(html)
+    if not match:
+        return None
+    try:
+        return parse_app_state(json.loads(match.group(1)))
+    except json.JSONDecodeError as e:
+        logger.debug(f"Could not decode place page state: {str(e)}")
+        return None
+
+def parse_app_state(state) -> Optional[Dict]:
+    """
+    Read a lead from a decoded APP_INITIALIZATION_STATE.
+    
+    Args:
+        state: The state array, from the page HTML or window.APP_INITIALIZATION_STATE
+        
+    Returns:
+        Lead dictionary, or None if the state carries no place data
+    """
+    payload = _dig(state, 3, 6)
+    if not isinstance(payload, str):
+        return None
+    try:
+        return _lead_from_place(_dig(_load_xssi_json(payload), 6))
+    except json.JSONDecodeError as e:
+        logger.debug(f"Could not decode place payload: {str(e)}")
+        return None
+
+def fetch_listing_http(url: str) -> Optional[Dict]:
+    """
+    Fetch a listing over plain HTTP and read it without a browser.
+    
+    Args:
+        url: Google Maps listing URL
+        
+    Returns:
+        Lead dictionary, or None if the page couldn't be fetched or parsed
+        (e.g. a consent redirect), in which case a browser is needed
+    """
+    try:
+        response = _SESSION.get(url, headers={'User-Agent': random.choice(USER_AGENTS)}, timeout=10)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logger.debug(f"HTTP fetch failed for {url}: {str(e)}")
+        return None
+    
+    lead = parse_place_page(response.text)
+    if not lead:
+        return None
+    lead['url'] = url
+    return lead
+
+def read_search_responses(driver) -> List[Dict]:
+    """
+    Collect leads from the search XHRs the page has received so far.
+    
+    Reads Network.responseReceived events from the performance log (see
+    create_search_driver) and fetches matching bodies through CDP. The log
+    is drained, so each response is only read once.
+    
+    Args:
+        driver: Search driver with performance logging and Network enabled
+        
+    Returns:
+        List of lead dictionaries, empty if no search XHR was captured
+    """
+    leads = []
+    try:
+        entries = driver.get_log('performance')
+    except WebDriverException as e:
+        logger.debug(f"Performance log unavailable: {str(e)}")
+        return leads
+    
+    for entry in entries:
+        message = json.loads(entry['message'])['message']
+        if message.get('method') != 'Network.responseReceived':
+            continue
+        params = message['params']
+        if not all(marker in params['response']['url'] for marker in SEARCH_XHR_MARKERS):
+            continue
+        try:
+            body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": params['requestId']})
+        except WebDriverException as e:
+            logger.debug(f"Search response body no longer available: {str(e)}")
+            continue
+        leads.extend(parse_search_response(body.get('body') or ''))
+    
+    logger.info(f"Read {len(leads)} leads from search responses")
+    return leads
+
+def create_search_driver(debugger_address: Optional[str] = None) -> webdriver.Chrome:
+    """Build the Chrome used to run searches and scroll the results feed.
+    
+    The window is visible unless MAPS_HEADLESS=1.
+    
+    Args:
+        debugger_address: host:port of an already-running Chrome to attach
+            to instead of launching one
+    """
+    if debugger_address:
+        driver = attach_chrome_driver(debugger_address, performance_log=True)
+    else:
+        driver = setup_chrome_driver(headless=MAPS_HEADLESS, performance_log=True, fast_mode=True)
+    driver.set_window_size(1920, 1080)
+    
+    # Skip images, fonts and ads; nothing is read from them
+    try:
+        block_urls(driver, SEARCH_BLOCKED_URL_PATTERNS)
+    except WebDriverException as e:
+        logger.warning(f"Could not enable resource blocking: {str(e)}")
+    return driver
+
+# Warm search browsers kept across scrape() calls, quit at interpreter exit;
+# each is replaced after SEARCH_DRIVER_MAX_USES searches as Chrome slows with age
+SEARCH_DRIVER_MAX_USES = 50
+SEARCH_DRIVERS = DriverPool(create_search_driver, max_uses=SEARCH_DRIVER_MAX_USES)
+atexit.register(SEARCH_DRIVERS.close)
+
+def attach_search_browser(port: int) -> None:
+    """
+    Run searches on a Chrome already listening on a local debugging port.
+    
+    Start one with start_persistent_browser.py; it then survives between
+    runs, so scrape() skips browser startup entirely. Only one search runs
+    on it at a time, so use with scrape() rather than scrape_many().
+    
+    Args:
+        port: The browser's --remote-debugging-port
+    """
+    global SEARCH_DRIVERS
+    SEARCH_DRIVERS.close()
+    SEARCH_DRIVERS = DriverPool(
+        functools.partial(create_search_driver, f"127.0.0.1:{port}"), max_uses=SEARCH_DRIVER_MAX_USES
+    )
+    atexit.register(SEARCH_DRIVERS.close)
+
+@contextmanager
+def borrow_search_driver() -> Iterator[webdriver.Chrome]:
+    """
+    Borrow a warm search driver, returning it to SEARCH_DRIVERS afterwards.
+    
+    On return the driver is parked on about:blank and its performance log is
+    drained, so the next search only sees its own responses. Cookies are
+    kept so the consent prompt isn't shown again.
+    
+    Yields:
+        A search driver, see create_search_driver
+    """
+    with SEARCH_DRIVERS.acquire() as driver:
+        yield driver
+        driver.get("about:blank")
+        driver.get_log('performance')
+
+def collect_result_cards(driver, keyword: str, location: str, max_results: int = 15) -> List[Dict]:
+    """
+    Run a Maps search and scroll its results feed for result cards.
+    
+    The cards on screen are read after each scroll with a single CDP call
+    (see fetch_results_via_cdp). Layouts whose cards carry no place link
+    fall back to extract_listing_urls, giving cards with only a URL.
+    
+    Args:
+        driver: Search driver, see create_search_driver
+        keyword: Business type to search for
+        location: Location to search in
+        max_results: Maximum number of cards to collect
+        
+    Returns:
+        Up to max_results card leads with unique listing URLs under 'url',
+        empty if the search found nothing
+    """
+    # Go straight to the search URL rather than typing into the search box
+    logger.info(f"Navigating to Google Maps to search for {keyword} in {location}")
+    with SEARCH_LIMITER:
+        driver.get(f"{MAPS_SEARCH_URL}{quote_plus(f'{keyword} in {location}')}")
+    try:
+        WebDriverWait(driver, 15, poll_frequency=0.1).until(RESULTS_OR_CONSENT_COND)
+    except TimeoutException:
+        logger.warning("Neither the results list nor a consent prompt appeared")
+    
+    # Handle cookie consent if present; only candidate buttons cross the wire
+    try:
+        cookie_buttons = driver.find_elements(*CONSENT_BUTTONS_LOC)
+        for button in cookie_buttons:
+            if _CONSENT_RE.search(button.text):
                 try:
-                    result = future.result()
-                    if result and result.get('business_name'):  # Only add valid results
-                        results.append(result)
-                        processed += 1
-                        logger.info(f"Processed {processed}/{total_urls}: {result.get('business_name', 'Unknown')}")
-                    else:
-                        logger.warning(f"Skipping invalid result for URL: {url}")
-                except Exception as e:
-                    logger.error(f"Error processing {url}: {str(e)}")
+                    button.click()
+                    wait_for(driver, RESULT_LIST_LOC, timeout=5)
+                    break
+                except Exception as click_err:
+                    logger.debug(f"Could not click consent button: {click_err}")
+    except Exception as e:
+        logger.debug(f"Cookie handling error: {str(e)}")
+
+    # Wait for the results list, refreshing once if it never shows
+    if not wait_for_results(driver, timeout=20):
+        logger.warning("Results not found, refreshing once")
+        driver.refresh()
+        if not wait_for_results(driver, timeout=20):
+            logger.warning("No results found after refreshing")
+            return []
+
+    # Track cards by their unique URLs while scrolling
+    seen_cards: Dict[str, Dict] = {}
+    consecutive_no_new_urls = 0
+    max_no_new_urls = 5  # Maximum attempts without finding new URLs before giving up
+    
+    while len(seen_cards) < max_results:
+        # Scroll the results pane
+        if not scroll_results_pane(driver):
+            logger.warning("Failed to scroll, checking if we have enough unique URLs")
+            consecutive_no_new_urls += 1
+        
+        # Read every loaded card in one CDP call; only fall back to the
+        # URL harvest when no card had a place link
+        cards = [card for card in fetch_results_via_cdp(driver) if card.get('url')]
+        if not cards:
+            cards = [{'url': url} for url in extract_listing_urls(driver, max_results * 2)]
+        
+        # Add cards with new URLs, stopping as soon as the quota is met
+        new_count = 0
+        for card in cards:
+            if card['url'] not in seen_cards:
+                seen_cards[card['url']] = card
+                new_count += 1
+                if len(seen_cards) >= max_results:
+                    break
         
-        # Small delay between batches
-        if len(url_batches) > 1:
-            time.sleep(2)
+        if new_count:
+            # Reset counter when we find new URLs
+            consecutive_no_new_urls = 0
+            logger.info(f"Found {new_count} new URLs, total unique URLs: {len(seen_cards)}")
+        else:
+            consecutive_no_new_urls += 1
+            logger.warning(f"No new URLs found (attempt {consecutive_no_new_urls}/{max_no_new_urls})")
+        
+        # Stop if we've tried too many times without finding new URLs
+        if consecutive_no_new_urls >= max_no_new_urls:
+            logger.warning(f"Stopping after {max_no_new_urls} attempts without new URLs")
+            break
+        
+        # scroll_results_pane already waited for new cards; this is only
+        # anti-bot jitter between scrolls
+        random_sleep(0.2, 0.5)
     
-    logger.info(f"Parallel processing complete. Processed {len(results)} valid results from {total_urls} URLs")
-    return results
+    # Use the collected unique cards
+    result_cards = list(seen_cards.values())[:max_results]
+    logger.info(f"Collected {len(result_cards)} unique URLs for processing")
+    
+    return result_cards
+
+def _listing_name(url: str) -> str:
+    """Return the lowercased place name from a /maps/place/<name>/ URL, or ''."""
+    match = _PLACE_NAME_RE.search(url)
+    return unquote_plus(match.group(1)).strip().lower() if match else ''
+
+def uncovered_listing_urls(listing_urls: List[str], leads: List[Dict]) -> List[str]:
+    """
+    Drop listing URLs whose place is already among leads.
+    
+    Listing URLs carry the place name in their path, which is matched
+    against the leads' business names.
+    
+    Args:
+        listing_urls: Listing URLs collected from the results feed
+        leads: Leads already read, e.g. from search responses
+        
+    Returns:
+        The listing URLs not covered by leads, in their original order
+    """
+    names = {(lead.get('business_name') or '').strip().lower() for lead in leads}
+    names.discard('')
+    return [url for url in listing_urls if _listing_name(url) not in names]
+
+def search_listings(driver, keyword: str, location: str, max_results: int = 15) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Run a search and split its places into leads and listings still to open.
+    
+    Maps already sends the listed places as JSON with the search; when that
+    was captured, those places need no browser. The XHRs can miss places,
+    e.g. the first page embedded in the initial document, so result cards
+    they don't cover are still returned.
+    
+    Args:
+        driver: Search driver, see create_search_driver
+        keyword: Business type to search for
+        location: Location to search in
+        max_results: Maximum number of result cards to collect
+        
+    Returns:
+        Tuple of (leads read from the search responses, result cards none
+        of those leads cover), see merge_listing_details for the cards
+    """
+    cards = collect_result_cards(driver, keyword, location, max_results)
+    search_leads = read_search_responses(driver)
+    uncovered = set(uncovered_listing_urls([card['url'] for card in cards], search_leads))
+    return search_leads, [card for card in cards if card['url'] in uncovered]
+
+def merge_listing_details(cards: List[Dict], max_workers: int = 10) -> Iterator[Dict]:
+    """
+    Deep-link result cards to their listing pages, scraped in parallel.
+    
+    Cards carry the listing URL, so details come from scrape_listings_parallel
+    instead of clicking each card open in the search window and navigating
+    back. Fields the listing left empty, such as the address a listing read
+    from the DOM lacks, are filled in from the card.
+    
+    Args:
+        cards: Result cards, see collect_result_cards
+        max_workers: Maximum number of worker threads
+        
+    Yields:
+        Listing leads completed from their cards, as each listing finishes
+    """
+    cards_by_url = {card['url']: card for card in cards}
+    for lead in scrape_listings_parallel(list(cards_by_url), max_workers=max_workers):
+        card = cards_by_url.get(lead.get('url'), {})
+        yield {**lead, **{k: v for k, v in card.items() if v and not lead.get(k)}}
+
+def scrape_iter(keyword: str, location: str, max_results: int = 15) -> Iterator[Dict[str, str]]:
+    """
+    Yield unique leads for a search as soon as each one is ready.
+    
+    Nothing is buffered, so streaming consumers (DB inserts, UI updates)
+    see each lead immediately; stopping iteration early cancels the
+    listings still queued.
+    
+    Args:
+        keyword: Business type to search for
+        location: Location to search in
+        max_results: Maximum number of leads to yield
+        
+    Yields:
+        Dictionaries containing business information
+    """
+    # Search on a warm browser, handed back before the listing phase
+    with borrow_search_driver() as driver:
+        search_leads, listing_cards = search_listings(driver, keyword, location, max_results)
+    
+    index = LeadIndex()
+    remaining = max_results
+    for lead in search_leads:
+        if not remaining:
+            return
+        if index.add(lead):
+            remaining -= 1
+            yield lead
+    if not remaining:
+        return
+    
+    if not listing_cards:
+        if not search_leads:
+            logger.error("No listing URLs extracted")
+        return
+    
+    # Process listings in parallel, yielding each lead as it completes
+    unique_leads = (
+        lead for lead in merge_listing_details(listing_cards, max_workers=10)  # Using 10 workers as requested
+        if index.add(lead)
+    )
+    yield from itertools.islice(unique_leads, remaining)
 
 @retry_with_backoff
 def scrape(
@@ -880,6 +1987,9 @@ def scrape(
     """
     Main scraping function that coordinates the process.
     
+    Collects scrape_iter's leads into a list; use scrape_iter directly to
+    stream them instead.
+    
     Args:
         keyword: Business type to search for
         location: Location to search in
@@ -890,168 +2000,106 @@ def scrape(
     Returns:
         List of dictionaries containing business information
     """
-    driver = None
     try:
-        # Initialize Chrome with a visible window for better interaction
-        driver = setup_chrome_driver(headless=False)
-        driver.set_window_size(1920, 1080)
-        
-        # Navigate to Google Maps and wait for it to load
-        logger.info(f"Navigating to Google Maps to search for {keyword} in {location}")
-        driver.get("https://www.google.com/maps")
-        random_sleep(3, 5)  # Increased initial wait time
-        
-        # Handle cookie consent if present
-        try:
-            cookie_buttons = driver.find_elements(By.CSS_SELECTOR, 'button')
-            for button in cookie_buttons:
-                button_text = button.text.lower()
-                if any(text in button_text for text in ['accept', 'agree', 'consent']):
-                    try:
-                        button.click()
-                        random_sleep(1, 2)
-                        break
-                    except Exception as click_err:
-                        logger.debug(f"Could not click consent button: {click_err}")
-        except Exception as e:
-            logger.debug(f"Cookie handling error: {str(e)}")
-
-        # Wait for and find search box with retry
-        search_box = None
-        for attempt in range(3):
-            try:
-                search_box = WebDriverWait(driver, 10).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, SEARCH_BOX))
-                )
-                break
-            except Exception as e:
-                logger.warning(f"Search box not found on attempt {attempt + 1}: {str(e)}")
-                if attempt < 2:
-                    random_sleep(2, 3)
-                    driver.refresh()
-
-        if not search_box:
-            raise Exception("Could not find search box after multiple attempts")
-
-        # Clear and fill search box
-        search_box.clear()
-        random_sleep(0.5, 1)
-        search_box.send_keys(f"{keyword} in {location}")
-        random_sleep(1, 2)
-
-        # Try clicking search button first
-        search_clicked = False
-        try:
-            search_button = WebDriverWait(driver, 5).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, SEARCH_BUTTON))
-            )
-            if search_button:
-                search_button.click()
-                search_clicked = True
-                logger.info("Clicked search button")
-        except Exception as e:
-            logger.debug(f"Could not click search button: {str(e)}")
-
-        # If button click failed, use Enter key
-        if not search_clicked:
-            search_box.send_keys(Keys.RETURN)
-            logger.info("Used Enter key for search")
-
-        # Wait longer for initial results with multiple checks
-        random_sleep(3, 5)
-        results_found = False
-        for attempt in range(3):
-            if wait_for_results(driver, timeout=10):
-                results_found = True
-                break
-            else:
-                logger.warning(f"Results not found on attempt {attempt + 1}, retrying...")
-                random_sleep(2, 3)
-                # Try refreshing if results don't load
-                if attempt < 2:
-                    driver.refresh()
-                    random_sleep(2, 3)
-
-        if not results_found:
-            logger.warning("No results found after multiple attempts")
-            return []
-
-        # Track unique URLs while scrolling
-        seen_urls = set()
-        consecutive_no_new_urls = 0
-        max_no_new_urls = 5  # Maximum attempts without finding new URLs before giving up
-        
-        while len(seen_urls) < max_results:
-            # Scroll the results pane
-            if not scroll_results_pane(driver):
-                logger.warning("Failed to scroll, checking if we have enough unique URLs")
-                consecutive_no_new_urls += 1
-            
-            # Extract current visible URLs
-            current_urls = set(extract_listing_urls(driver, max_results * 2))  # Extract more to ensure we find new ones
-            new_urls = current_urls - seen_urls
-            
-            if new_urls:
-                # Reset counter when we find new URLs
-                consecutive_no_new_urls = 0
-                seen_urls.update(new_urls)
-                logger.info(f"Found {len(new_urls)} new URLs, total unique URLs: {len(seen_urls)}")
-            else:
-                consecutive_no_new_urls += 1
-                logger.warning(f"No new URLs found (attempt {consecutive_no_new_urls}/{max_no_new_urls})")
-            
-            # Stop if we've tried too many times without finding new URLs
-            if consecutive_no_new_urls >= max_no_new_urls:
-                logger.warning(f"Stopping after {max_no_new_urls} attempts without new URLs")
-                break
-                
-            random_sleep(2, 3)
-        
-        # Use the collected unique URLs
-        listing_urls = list(seen_urls)[:max_results]
-        logger.info(f"Collected {len(listing_urls)} unique URLs for processing")
-        
-        if not listing_urls:
-            logger.error("No listing URLs extracted")
-            return []
-            
-        # Close the main driver before parallel processing
-        driver.quit()
-        driver = None
-        
-        # Process listings in parallel with increased worker count
-        leads = scrape_listings_parallel(
-            listing_urls,
-            max_workers=10  # Using 10 workers as requested
-        )
-        
-        # Report progress through callback
-        if on_lead_callback:
-            for lead in leads:
+        leads = []
+        for lead in scrape_iter(keyword, location, max_results):
+            if on_lead_callback:
                 on_lead_callback(lead)
-        
+            leads.append(lead)
         return leads
         
     except Exception as e:
         logger.error(f"Error in main scrape function: {str(e)}")
         return []
+
+def scrape_many(
+    queries: List[tuple],
+    max_results: int = 15,
+    max_concurrency: int = 4,
+    on_lead_callback = None
+) -> Dict[tuple, List[Dict[str, str]]]:
+    """
+    Scrape several (keyword, location) searches on a pool of warm browsers.
+    
+    Searches run concurrently on up to max_concurrency reused search drivers,
+    so Chrome starts at most that many times for the whole batch. As in
+    scrape_iter, places read from a search's XHRs need no browser; the
+    listings they miss are scraped as soon as the search is done. A lead
+    already returned for an earlier search is not repeated.
+    
+    Args:
+        queries: List of (keyword, location) pairs
+        max_results: Maximum number of results per search
+        max_concurrency: Maximum number of searches in flight
+        on_lead_callback: Optional callback for progress updates
         
-    finally:
-        if driver:
-            driver.quit()
+    Returns:
+        Leads for each (keyword, location) pair, empty for failed searches
+    """
+    queries = list(dict.fromkeys(queries))
+    results: Dict[tuple, List[Dict[str, str]]] = {query: [] for query in queries}
+    if not queries:
+        return results
+    
+    # Overlapping searches find the same places; one hash index spans the batch
+    seen = LeadIndex()
+    
+    def collect(query: tuple) -> Tuple[List[Dict], List[Dict]]:
+        keyword, location = query
+        with borrow_search_driver() as driver:
+            return search_listings(driver, keyword, location, max_results)
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(queries)))) as executor:
+        future_to_query = {executor.submit(collect, query): query for query in queries}
+        
+        # Listing scrapes share the lead store, so they run one search at a time
+        for future in as_completed(future_to_query):
+            query = future_to_query[future]
+            try:
+                search_leads, listing_cards = future.result()
+            except Exception as e:
+                logger.error(f"Error searching {query[0]} in {query[1]}: {str(e)}")
+                continue
+            
+            if not search_leads and not listing_cards:
+                logger.error(f"No listing URLs extracted for {query[0]} in {query[1]}")
+                continue
+            
+            # Places read from the search XHRs first; browsers only open the rest
+            leads = search_leads
+            if listing_cards:
+                leads = itertools.chain(search_leads, merge_listing_details(listing_cards, max_workers=10))
+            for lead in leads:
+                if len(results[query]) >= max_results:
+                    break
+                if not seen.add(lead):
+                    continue
+                if on_lead_callback:
+                    on_lead_callback(lead)
+                results[query].append(lead)
+    
+    return results
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Scrape Google Maps for business leads")
     parser.add_argument("keyword", help="Type of business to search for")
     parser.add_argument("location", help="Location to search in")
     parser.add_argument("--max_results", type=int, default=15, help="Maximum number of results to return")
+    parser.add_argument("--attach-to", type=int, metavar="PORT", help="Search on a Chrome already running with --remote-debugging-port=PORT")
     args = parser.parse_args()
     
+    if args.attach_to:
+        attach_search_browser(args.attach_to)
+    
     def print_lead(lead):
         print(f"\n{lead.get('business_name', 'Unnamed business')}")
         print(f"   Phone: {lead.get('phone', 'N/A')}")
         print(f"   Website: {lead.get('website', 'N/A')}")
         print(f"   Rating: {lead.get('rating', 'N/A')}")
     
-    results = scrape(args.keyword, args.location, max_results=args.max_results, on_lead_callback=print_lead)
-    print(f"\nFound {len(results)} results")
\ No newline at end of file
+    # Print leads as they stream in rather than after the whole scrape
+    found = 0
+    for lead in scrape_iter(args.keyword, args.location, max_results=args.max_results):
+        print_lead(lead)
+        found += 1
+    print(f"\nFound {found} results")
\ No newline at end of file
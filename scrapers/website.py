@@ -1,9 +1,24 @@
 """Website scraper module for enriching lead data."""
+import atexit
+import functools
 import re
-from typing import Dict, List, Optional, Set
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Set
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    # Fallback to the pure-Python parser when lxml isn't installed
+    HTML_PARSER = 'html.parser'
+from urllib.parse import parse_qs, unquote, urljoin, urlparse
 from utils.logger import setup_logger
 from utils.decorators import retry_with_backoff
 
@@ -16,12 +31,47 @@ SOCIAL_PATTERNS = {
     'facebook': r'facebook\.com/[\w\.-]+',
     'linkedin': r'linkedin\.com/(?:company|in)/[\w\.-]+'
 }
+EMAIL_RE = re.compile(EMAIL_PATTERN, re.IGNORECASE)
+# Retina asset names like logo@2x.png look like emails in raw HTML
+_ASSET_SUFFIXES = ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg', '.css', '.js')
+# One alternation with a named group per platform, so each href is scanned once
+SOCIAL_RE = re.compile(
+    '|'.join(f'(?P<{platform}>{pattern})' for platform, pattern in SOCIAL_PATTERNS.items()),
+    re.IGNORECASE
+)
 TECH_PATTERNS = {
     'wordpress': 'wp-content',
     'shopify': 'cdn.shopify.com',
     'magento': 'static/version'
 }
 
+# Websites are fetched concurrently; each one is independent network I/O
+ENRICH_MAX_WORKERS = 16
+
+# Shared HTTP session so worker threads reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=ENRICH_MAX_WORKERS, pool_maxsize=ENRICH_MAX_WORKERS))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=ENRICH_MAX_WORKERS, pool_maxsize=ENRICH_MAX_WORKERS))
+_SESSION.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0.4472.124'
+_SESSION.headers['Accept'] = 'text/html,application/xhtml+xml;q=0.9,*/*;q=0.1'
+atexit.register(_SESSION.close)
+
+# Leads of one chain often share a host; don't hit it with the whole pool
+MAX_REQUESTS_PER_HOST = 4
+# Longest Retry-After honoured before giving up on a rate-limited site
+MAX_RETRY_AFTER = 30.0
+_host_slots: Dict[str, threading.BoundedSemaphore] = {}
+
+# Only HTML pages are worth parsing, and only their first couple of MB
+HTML_CONTENT_TYPES = {'text/html', 'application/xhtml+xml'}
+MAX_PAGE_BYTES = 2_000_000
+
+# Distinct websites remembered per process, see _scrape_page
+WEBSITE_CACHE_SIZE = 2048
+# Ports implied by their scheme, dropped from cache keys
+_DEFAULT_PORTS = {'http': ':80', 'https': ':443'}
+_host_slots_lock = threading.Lock()
+
 def extract_emails(text: str) -> Set[str]:
     """
     Extract email addresses from text using regex.
@@ -32,7 +82,14 @@ def extract_emails(text: str) -> Set[str]:
     Returns:
         Set of unique email addresses found
     """
-    return set(re.findall(EMAIL_PATTERN, text, re.IGNORECASE))
+    emails = set()
+    # finditer dedups as it goes; template headers and footers repeat the
+    # same address many times, and findall would build a list of them all
+    for match in EMAIL_RE.finditer(text):
+        email = match.group()
+        if email not in emails and not email.lower().endswith(_ASSET_SUFFIXES):
+            emails.add(email)
+    return emails
 
 def extract_social_links(soup: BeautifulSoup, base_url: str) -> Dict[str, str]:
     """
@@ -42,16 +99,54 @@ def extract_social_links(soup: BeautifulSoup, base_url: str) -> Dict[str, str]:
         soup: BeautifulSoup object of parsed HTML
         base_url: Website's base URL for resolving relative links
         
+    Returns:
+        Dictionary mapping platform names to profile URLs
+    """
+    return social_links_from_hrefs((link['href'] for link in soup.find_all('a', href=True)), base_url)
+
+def mailto_addresses(href: str) -> Set[str]:
+    """
+    Extract the email addresses of a mailto: link.
+    
+    Args:
+        href: Link target
+        
+    Returns:
+        Valid addresses from the recipient list and its to/cc/bcc fields,
+        empty for other links
+    """
+    parsed = urlparse(href)
+    if parsed.scheme.lower() != 'mailto':
+        return set()
+    
+    candidates = unquote(parsed.path).split(',')
+    query = parse_qs(parsed.query)
+    for field in ('to', 'cc', 'bcc'):
+        for value in query.get(field, ()):
+            candidates.extend(value.split(','))
+    
+    return {address.strip() for address in candidates if EMAIL_RE.match(address.strip())}
+
+def social_links_from_hrefs(hrefs: Iterable[str], base_url: str) -> Dict[str, str]:
+    """
+    Pick social media profile links out of already-collected hrefs.
+    
+    Args:
+        hrefs: Link targets, possibly relative
+        base_url: Website's base URL for resolving relative links
+        
     Returns:
         Dictionary mapping platform names to profile URLs
     """
     social_links = {}
     
-    for platform, pattern in SOCIAL_PATTERNS.items():
-        for link in soup.find_all('a', href=True):
-            href = urljoin(base_url, link['href'])
-            if re.search(pattern, href, re.IGNORECASE):
-                social_links[platform] = href
+    # Single pass over the links; the first link found for a platform wins
+    for href in hrefs:
+        href = urljoin(base_url, href)
+        match = SOCIAL_RE.search(href)
+        if match and match.lastgroup not in social_links:
+            social_links[match.lastgroup] = href
+            if len(social_links) == len(SOCIAL_PATTERNS):
                 break
     
     return social_links
@@ -74,6 +169,132 @@ def detect_technologies(html: str) -> List[str]:
     
     return technologies
 
+@contextmanager
+def _host_slot(url: str) -> Iterator[None]:
+    """Hold one of the MAX_REQUESTS_PER_HOST request slots for url's host."""
+    host = urlparse(url).netloc.lower()
+    with _host_slots_lock:
+        slot = _host_slots.setdefault(host, threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST))
+    with slot:
+        yield
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """
+    Read how long a rate-limited response asks us to wait.
+    
+    Args:
+        response: A 429 or 503 response
+        
+    Returns:
+        Seconds to wait, or None if there is no usable Retry-After header
+    """
+    value = (response.headers.get('Retry-After') or '').strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    
+    # Otherwise an HTTP-date
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+def _read_html(response: requests.Response) -> str:
+    """Read a streamed response body as text, stopping at MAX_PAGE_BYTES."""
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        body += chunk
+        if len(body) >= MAX_PAGE_BYTES:
+            logger.debug(f"Truncating {response.url} at {MAX_PAGE_BYTES} bytes")
+            break
+    try:
+        return body[:MAX_PAGE_BYTES].decode(response.encoding or 'utf-8', errors='replace')
+    except LookupError:
+        return body[:MAX_PAGE_BYTES].decode('utf-8', errors='replace')
+
+def _canonical_url(url: str) -> str:
+    """Normalize a website URL so variants of one page share a cache entry."""
+    if not url.startswith(('http://', 'https://')):
+        url = f'https://{url}'
+    parts = urlparse(url)
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    # An explicit default port names the same site as no port at all
+    default_port = _DEFAULT_PORTS.get(scheme)
+    if default_port and netloc.endswith(default_port):
+        netloc = netloc[:-len(default_port)]
+    return parts._replace(
+        scheme=scheme,
+        netloc=netloc,
+        path=parts.path.rstrip('/'),
+        fragment=''
+    ).geturl()
+
+@functools.lru_cache(maxsize=WEBSITE_CACHE_SIZE)
+def _scrape_page(url: str, timeout: int) -> tuple:
+    """
+    Fetch and scan one page, memoized per canonical URL.
+    
+    Chains and franchises often list the same website, so each page is
+    fetched once per process. Errors propagate and are not cached.
+    
+    Returns:
+        Immutable (emails, social link items, technologies) triple
+    """
+    with _host_slot(url):
+        # Streamed, so the headers can be checked before any body is read
+        response = _SESSION.get(url, timeout=timeout, stream=True)
+        
+        # Honour the server's own rate-limit hint once rather than
+        # retrying blindly; holding the host slot keeps others waiting too
+        if response.status_code in (429, 503):
+            delay = _retry_after_seconds(response)
+            if delay is not None and delay <= MAX_RETRY_AFTER:
+                logger.info(f"Rate limited by {url}, retrying in {delay:.1f}s")
+                response.close()
+                time.sleep(delay)
+                response = _SESSION.get(url, timeout=timeout, stream=True)
+    
+    with response:
+        response.raise_for_status()
+        
+        # Skip PDFs, images and other downloads without reading them
+        content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type and content_type not in HTML_CONTENT_TYPES:
+            logger.info(f"Skipping non-HTML content at {url}: {content_type}")
+            return frozenset(), (), ()
+        
+        html = _read_html(response)
+    
+    # Emails and technologies are read from the raw HTML, so only the
+    # links need parsing; one pass collects their hrefs for both uses
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=SoupStrainer('a', href=True))
+    hrefs = [link['href'] for link in soup.find_all('a', href=True)]
+    
+    # Scan the raw HTML rather than materializing the page text; this
+    # also picks up addresses in mailto: hrefs
+    emails = extract_emails(html)
+    
+    # Fall back to mailto: links only when the scan found nothing
+    if not emails:
+        for href in hrefs:
+            emails |= mailto_addresses(href)
+    
+    # Get social links
+    social_links = social_links_from_hrefs(hrefs, url)
+    
+    # Detect technologies
+    technologies = detect_technologies(html)
+    
+    logger.info(f"Successfully scraped {url}")
+    logger.info(f"Found {len(emails)} emails and {len(social_links)} social links")
+    
+    return frozenset(emails), tuple(social_links.items()), tuple(technologies)
+
 @retry_with_backoff
 def scrape_website(url: str, timeout: int = 5) -> Dict:
     """
@@ -89,105 +310,96 @@ def scrape_website(url: str, timeout: int = 5) -> Dict:
     if not url:
         return {'emails': set(), 'social_links': {}, 'technologies': []}
     
-    if not url.startswith(('http://', 'https://')):
-        url = f'https://{url}'
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0.4472.124'
-    }
+    url = _canonical_url(url)
     
     try:
-        response = requests.get(url, headers=headers, timeout=timeout)
-        response.raise_for_status()
-        
-        html = response.text
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Extract all text content
-        text_content = soup.get_text()
-        
-        # Find emails
-        emails = extract_emails(text_content)
-        
-        # Also check mailto: links
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            if href.startswith('mailto:'):
-                email = href.replace('mailto:', '').split('?')[0]
-                if re.match(EMAIL_PATTERN, email):
-                    emails.add(email)
-        
-        # Get social links
-        social_links = extract_social_links(soup, url)
-        
-        # Detect technologies
-        technologies = detect_technologies(html)
-        
-        logger.info(f"Successfully scraped {url}")
-        logger.info(f"Found {len(emails)} emails and {len(social_links)} social links")
-        
-        return {
-            'emails': emails,
-            'social_links': social_links,
-            'technologies': technologies
-        }
-        
+        emails, social_links, technologies = _scrape_page(url, timeout)
     except Exception as e:
         logger.error(f"Error scraping {url}: {str(e)}")
         return {'emails': set(), 'social_links': {}, 'technologies': []}
+    
+    # Fresh containers, so callers can't alter the cached result
+    return {
+        'emails': set(emails),
+        'social_links': dict(social_links),
+        'technologies': list(technologies)
+    }
 
-def enrich(leads: List[Dict], on_lead_callback=None) -> List[Dict]:
+def _apply_website_data(lead: Dict, website_data: Dict) -> None:
+    """Copy scrape_website findings onto a lead and note them."""
+    lead['emails'] = list(website_data['emails'])
+    lead['social_links'] = website_data['social_links']
+    lead['technologies'] = website_data['technologies']
+    
+    # Add notes about findings
+    notes = []
+    if website_data['technologies']:
+        notes.append(f"Technologies: {', '.join(website_data['technologies'])}")
+    if website_data['social_links']:
+        notes.append(f"Social profiles: {', '.join(website_data['social_links'].keys())}")
+    
+    if lead.get('notes'):
+        if notes:
+            lead['notes'] += ' | ' + ' | '.join(notes)
+    else:
+        lead['notes'] = ' | '.join(notes)
+
+def enrich(leads: List[Dict], on_lead_callback=None, max_workers: int = ENRICH_MAX_WORKERS) -> List[Dict]:
     """
     Enrich lead data with website information.
     
+    Websites are scraped concurrently on a thread pool; leads are updated
+    and reported on the calling thread as each website finishes.
+    
     Args:
         leads: List of lead dictionaries from Google Maps scraper
         on_lead_callback: Optional callback function to report progress
+        max_workers: Maximum number of websites fetched at once
         
     Returns:
         Enriched list of lead dictionaries with additional fields
     """
+    with_website = []
     for lead in leads:
         if lead.get('website'):
+            with_website.append(lead)
+            continue
+        
+        logger.info(f"No website found for {lead['business_name']}")
+        lead.update({
+            'emails': [],
+            'social_links': {},
+            'technologies': [],
+            'notes': lead.get('notes', '') + ' | No website available' if lead.get('notes') else 'No website available'
+        })
+        
+        # Call the callback even for leads without websites
+        if on_lead_callback:
+            on_lead_callback(lead)
+    
+    if not with_website:
+        return leads
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(with_website)))) as executor:
+        future_to_lead = {}
+        for lead in with_website:
             logger.info(f"Enriching data for {lead['business_name']}")
+            future_to_lead[executor.submit(scrape_website, lead['website'])] = lead
+        
+        for future in as_completed(future_to_lead):
+            lead = future_to_lead[future]
+            try:
+                website_data = future.result()
+            except Exception as e:
+                # One failing site shouldn't stop the others
+                logger.error(f"Error enriching {lead['business_name']}: {str(e)}")
+                website_data = {'emails': set(), 'social_links': {}, 'technologies': []}
             
-            # Scrape website
-            website_data = scrape_website(lead['website'])
-            
-            # Update lead with new information
-            lead['emails'] = list(website_data['emails'])
-            lead['social_links'] = website_data['social_links']
-            lead['technologies'] = website_data['technologies']
-            
-            # Add notes about findings
-            notes = []
-            if website_data['technologies']:
-                notes.append(f"Technologies: {', '.join(website_data['technologies'])}")
-            if website_data['social_links']:
-                notes.append(f"Social profiles: {', '.join(website_data['social_links'].keys())}")
-            
-            if lead.get('notes'):
-                if notes:
-                    lead['notes'] += ' | ' + ' | '.join(notes)
-            else:
-                lead['notes'] = ' | '.join(notes)
+            _apply_website_data(lead, website_data)
             
             # Call the callback with updated lead info if available
             if on_lead_callback:
                 on_lead_callback(lead)
-        
-        else:
-            logger.info(f"No website found for {lead['business_name']}")
-            lead.update({
-                'emails': [],
-                'social_links': {},
-                'technologies': [],
-                'notes': lead.get('notes', '') + ' | No website available' if lead.get('notes') else 'No website available'
-            })
-            
-            # Call the callback even for leads without websites
-            if on_lead_callback:
-                on_lead_callback(lead)
     
     return leads
 
@@ -0,0 +1,34 @@
+"""Launch a Chrome that Google Maps scrapes can attach to across runs.
+
+Usage:
+    python start_persistent_browser.py [--port 9222] [--profile /tmp/chrome-prof]
+    python -m scrapers.google_maps "cafe" "Berlin" --attach-to 9222
+"""
+import argparse
+import shutil
+import subprocess
+import sys
+
+CHROME_BINARIES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome')
+
+def find_chrome() -> str:
+    """Return the first Chrome/Chromium binary found on PATH."""
+    for name in CHROME_BINARIES:
+        path = shutil.which(name)
+        if path:
+            return path
+    sys.exit(f"No Chrome binary found on PATH (tried: {', '.join(CHROME_BINARIES)})")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Start a persistent Chrome for --attach-to")
+    parser.add_argument("--port", type=int, default=9222, help="Remote debugging port")
+    parser.add_argument("--profile", default="/tmp/chrome-prof", help="Chrome user data directory")
+    args = parser.parse_args()
+    
+    subprocess.Popen(
+        [find_chrome(), f"--remote-debugging-port={args.port}", f"--user-data-dir={args.profile}"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+    print(f"Chrome listening on 127.0.0.1:{args.port}; pass --attach-to {args.port} to the scraper")
@@ -0,0 +1,32 @@
+"""Tests for AI helper utilities."""
+import pytest
+from unittest.mock import patch
+from utils.ai_helpers import JSON_TOKEN_RE, extract_json_from_response
+
+@pytest.mark.parametrize("response_text, expected", [
+    ('{"name": "Test Cafe"}', {'name': 'Test Cafe'}),
+    ('Here you go:\n```json\n{"name": "Test Cafe"}\n```\nAnything else?', {'name': 'Test Cafe'}),
+    ('The analysis is {"score": 80, "tags": ["cafe"]} as requested.', {'score': 80, 'tags': ['cafe']}),
+    ('{"quote": "she said \\"hi\\" {"}', {'quote': 'she said "hi" {'}),
+    ('Result: {"pattern": "a}b{c", "nested": {"ok": true}}', {'pattern': 'a}b{c', 'nested': {'ok': True}}),
+    ('Use {placeholders} then {"name": "Test Cafe"}', {'name': 'Test Cafe'}),
+    ('An open { brace first, then {"name": "Test Cafe"}', {'name': 'Test Cafe'}),
+    ('[{"name": "Test Cafe"}]', {'name': 'Test Cafe'}),
+])
+def test_extract_json_from_response(response_text, expected):
+    """Test JSON extraction from bare, fenced and prose-wrapped responses."""
+    assert extract_json_from_response(response_text) == expected
+
+@pytest.mark.parametrize("response_text", ['', 'No JSON here', '{"unterminated": ', '{not json}', '["cafe", "bar"]'])
+def test_extract_json_from_response_without_json(response_text):
+    """Test that responses without parseable JSON return None."""
+    assert extract_json_from_response(response_text) is None
+
+def test_extract_json_from_response_scans_unclosed_braces_once():
+    """Test that many unclosed braces don't force a rescan from each one."""
+    response_text = 'Draft { unclosed ' * 20000 + '{"name": "Test Cafe"}'
+    
+    with patch('utils.ai_helpers.JSON_TOKEN_RE', wraps=JSON_TOKEN_RE) as token_re:
+        assert extract_json_from_response(response_text) == {'name': 'Test Cafe'}
+    
+    assert token_re.finditer.call_count == 1
@@ -1,7 +1,8 @@
 """Tests for the main controller module."""
+import csv
 import pytest
 from unittest.mock import patch, MagicMock
-import pandas as pd
+from openpyxl import load_workbook
 from controllers.main_controller import LeadController
 
 @pytest.fixture
@@ -91,15 +92,41 @@ def test_run_full_data_mode(mock_enrich, mock_scrape_maps, controller, sample_le
     assert 'emails' in result['leads'][0]
     assert 'export_paths' in result
 
-@patch('pandas.DataFrame.to_csv')
-@patch('pandas.DataFrame.to_excel')
-def test_export_data(mock_to_excel, mock_to_csv, controller, sample_leads):
-    """Test data export functionality."""
-    export_paths = controller.export_data(sample_leads, "Cafe", "New York")
+def test_export_data(controller, tmp_path, monkeypatch):
+    """Test that exports write real CSV and XLSX files with every lead field."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data" / "output").mkdir(parents=True)
+    leads = [
+        {
+            "business_name": "Test Cafe 1",
+            "phone": "123-456-7890",
+            "emails": ["a@test1.com", "b@test1.com"],
+            "_internal": "skip me"
+        },
+        {
+            "business_name": "Test Cafe 2",
+            "website": "https://test2.com",
+            "social_links": {"facebook": "https://facebook.com/test2"}
+        }
+    ]
+    
+    export_paths = controller.export_data(leads, "Cafe", "New York")
     
-    assert mock_to_csv.called
-    assert mock_to_excel.called
-    assert 'csv' in export_paths
-    assert 'xlsx' in export_paths
     assert export_paths['csv'].endswith('.csv')
-    assert export_paths['xlsx'].endswith('.xlsx')
\ No newline at end of file
+    assert export_paths['xlsx'].endswith('.xlsx')
+    assert export_paths['json'].endswith('.json')
+    expected_columns = ['business_name', 'phone', 'emails', 'website', 'social_links']
+    
+    with open(export_paths['csv'], newline='', encoding='utf-8') as csv_file:
+        rows = list(csv.reader(csv_file))
+    assert rows[0] == expected_columns
+    assert rows[1] == ['Test Cafe 1', '123-456-7890', "['a@test1.com', 'b@test1.com']", '', '']
+    assert rows[2] == ['Test Cafe 2', '', '', 'https://test2.com', "{'facebook': 'https://facebook.com/test2'}"]
+    
+    sheet = load_workbook(export_paths['xlsx'], read_only=True).active
+    xlsx_rows = list(sheet.iter_rows(values_only=True))
+    assert list(xlsx_rows[0]) == expected_columns
+    assert len(xlsx_rows) == len(leads) + 1
+    assert xlsx_rows[1][2] == "['a@test1.com', 'b@test1.com']"
+    assert xlsx_rows[2][4] == "{'facebook': 'https://facebook.com/test2'}"
+    assert xlsx_rows[2][1] is None
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""Tests for decorators."""
+import pytest
+from unittest.mock import MagicMock, patch
+from utils.decorators import retry_with_backoff
+
+RETRY_CONFIG = {"max_attempts": 5, "initial_delay": 1, "backoff_factor": 2}
+
+@pytest.fixture
+def clock():
+    """Patch time.sleep and time.monotonic with a fake clock, recording sleeps."""
+    state = {"now": 0.0, "sleeps": []}
+    
+    def fake_sleep(seconds):
+        state["sleeps"].append(seconds)
+        state["now"] += seconds
+    
+    with patch('utils.decorators.time.sleep', side_effect=fake_sleep), \
+         patch('utils.decorators.time.monotonic', side_effect=lambda: state["now"]):
+        yield state
+
+def test_retry_delays_stay_within_jitter_bounds(clock):
+    """Test that each backoff delay is within 0.5-1.5x of its base delay."""
+    func = MagicMock(side_effect=ValueError("boom"), __name__="func")
+    
+    with patch('utils.decorators.load_retry_config', return_value=RETRY_CONFIG):
+        with pytest.raises(ValueError):
+            retry_with_backoff(func)()
+    
+    assert func.call_count == 5
+    for attempt, delay in enumerate(clock["sleeps"]):
+        base = 1 * 2 ** attempt
+        assert 0.5 * base <= delay <= 1.5 * base
+
+def test_retry_stops_once_max_elapsed_passes(clock):
+    """Test that retries give up instead of sleeping past the time budget."""
+    func = MagicMock(side_effect=ValueError("boom"), __name__="func")
+    config = dict(RETRY_CONFIG, max_attempts=10, max_elapsed=5)
+    
+    with patch('utils.decorators.load_retry_config', return_value=config), \
+         patch('utils.decorators.random.uniform', return_value=1.0):
+        with pytest.raises(ValueError):
+            retry_with_backoff(func)()
+    
+    # Delays of 1s and 2s fit in the 5s budget; the next 4s would not
+    assert clock["sleeps"] == [1, 2]
+    assert func.call_count == 3
+    assert clock["now"] <= 5
+
+def test_retry_returns_after_transient_failure(clock):
+    """Test that a call succeeding on retry returns its result."""
+    func = MagicMock(side_effect=[ValueError("boom"), "ok"], __name__="func")
+    
+    with patch('utils.decorators.load_retry_config', return_value=RETRY_CONFIG):
+        assert retry_with_backoff(func)() == "ok"
+    
+    assert len(clock["sleeps"]) == 1
@@ -1,8 +1,18 @@
 """Tests for Google Maps scraper module."""
+import errno
+import json
+import os
+import subprocess
+import sys
 import pytest
+from contextlib import contextmanager
 from unittest.mock import MagicMock, patch
-from selenium.common.exceptions import NoSuchElementException
-from scrapers.google_maps import scrape
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchElementException, TimeoutException
+from scrapers.google_maps import (
+    scrape, scrape_iter, scrape_many, normalize_lead_data, is_duplicate_lead, parse_search_response,
+    fetch_results_via_cdp, merge_listing_details, scrape_single_listing, _scrape_listing,
+    LeadIndex, LeadStore, _claim_profile_slot, _release_profile_slot
+)
 
 @pytest.fixture
 def mock_driver():
@@ -85,4 +95,259 @@ def test_scrape_respects_max_pages(mock_setup_driver, mock_driver):
     
     # Count number of times find_elements was called (once per page)
     find_elements_calls = mock_driver.find_elements.call_count
-    assert find_elements_calls <= max_pages
\ No newline at end of file
+    assert find_elements_calls <= max_pages
+
+def test_normalize_lead_data_maps_item_ids():
+    """Test that raw data-item-id keys are normalized in one pass."""
+    raw = {
+        'place_name:cafe': 'Test Cafe',
+        'phone:tel:+15551234567': '',
+        'authority': 'https://testcafe.com',
+        'action:4:order': 'https://order.example.com/1',
+        'action:4:delivery': 'https://order.example.com/2',
+        'oh': 'Open 9-5'
+    }
+    
+    lead = normalize_lead_data(raw)
+    
+    assert lead['business_name'] == 'Test Cafe'
+    assert lead['phone'] == '+15551234567'
+    assert lead['website'] == 'https://testcafe.com'
+    assert lead['notes'] == (
+        'Order: https://order.example.com/1 | '
+        'Order: https://order.example.com/2 | Hours: Open 9-5'
+    )
+
+def test_lead_index_matches_name_or_phone():
+    """Test that LeadIndex flags a shared name or shared phone digits."""
+    index = LeadIndex([{'business_name': 'Test Cafe', 'phone': '(555) 123-4567'}])
+    
+    assert is_duplicate_lead(index, {'business_name': 'test cafe'})
+    assert is_duplicate_lead(index, {'business_name': 'Other', 'phone': '555-123-4567'})
+    assert not is_duplicate_lead(index, {'business_name': 'Other', 'phone': '555-000-0000'})
+    assert index.add({'business_name': 'Other'})
+    assert not index.add({'business_name': 'OTHER'})
+
+def test_is_duplicate_lead_scans_every_listed_lead():
+    """Test that list input matches leads that duplicate each other within the list."""
+    leads = [
+        {'business_name': 'Test Cafe', 'phone': '555-123-4567'},
+        {'business_name': 'Cafe Branch', 'phone': '(555) 123-4567'},
+    ]
+    
+    assert is_duplicate_lead(leads, {'business_name': 'cafe branch'})
+    assert is_duplicate_lead(leads, {'business_name': 'Other', 'phone': '5551234567'})
+    assert not is_duplicate_lead(leads, {'business_name': 'Other', 'phone': '555-000-0000'})
+    assert not is_duplicate_lead(leads, {'address': '12 Main Street'})
+
+def test_lead_index_address_overlap():
+    """Test that address overlap only counts when a threshold is set."""
+    lead = {'business_name': 'Test Cafe', 'address': '12 Main Street Springfield'}
+    nearby = {'business_name': 'Cafe Test', 'address': '12 main street, Springfield'}
+    
+    assert nearby not in LeadIndex([lead])
+    assert nearby in LeadIndex([lead], address_threshold=0.5)
+    assert {'business_name': 'Other', 'address': '9 Elm Road'} not in LeadIndex([lead], address_threshold=0.5)
+
+def test_lead_index_leaves_leads_untouched():
+    """Test that indexing doesn't add cache keys to the leads themselves."""
+    lead = {'business_name': 'Test Cafe', 'phone': '555-123-4567', 'address': '12 Main Street'}
+    index = LeadIndex(address_threshold=0.5)
+    
+    assert index.add(dict(lead)) and lead in index
+    assert not index.add(lead)
+    assert lead == {'business_name': 'Test Cafe', 'phone': '555-123-4567', 'address': '12 Main Street'}
+
+def test_lead_store_runs_are_isolated():
+    """Test that each LeadStore dedups on its own and cleans up its file."""
+    first, second = LeadStore(), LeadStore()
+    try:
+        assert first.add({'business_name': 'Test Cafe', 'phone': '555-123-4567'})
+        assert not first.add({'business_name': 'TEST CAFE'})
+        assert not first.add({'business_name': 'Other', 'phone': '(555) 123-4567'})
+        assert second.add({'business_name': 'Test Cafe'})
+        assert first.leads() == [{'business_name': 'Test Cafe', 'phone': '555-123-4567'}]
+    finally:
+        first.close()
+        second.close()
+    
+    assert not os.path.exists(first.db_path)
+
+def _search_place(name, address, place_id):
+    """Build a positional Maps place array the way search XHRs send it."""
+    place = [None] * 179
+    place[11] = name
+    place[39] = address
+    place[78] = place_id
+    return place
+
+def test_parse_search_response():
+    """Test that search XHR bodies are read behind the XSSI prefix and envelope."""
+    payload = [[None, [
+        [None] * 14 + [_search_place('Test Cafe', '12 Main Street', 'abc')],
+        [None] * 14 + [None],
+    ]]]
+    body = ")]}'\n" + json.dumps(payload)
+    
+    leads = parse_search_response(body)
+    
+    assert [lead['business_name'] for lead in leads] == ['Test Cafe']
+    assert leads[0]['address'] == '12 Main Street'
+    assert leads[0]['url'] == 'https://www.google.com/maps/place/?q=place_id:abc'
+    assert parse_search_response(json.dumps({'d': body})) == leads
+    assert parse_search_response('not json') == []
+
+def test_fetch_results_via_cdp_reads_cards_in_one_call():
+    """Test that every result card comes back from a single Runtime.evaluate."""
+    driver = MagicMock()
+    driver.execute_cdp_cmd.return_value = {'result': {'value': [{
+        'business_name': 'Test Cafe',
+        'address': '12 Main Street',
+        'rating_text': '4.5 stars',
+        'reviews': '(120)',
+        'place_url': 'https://www.google.com/maps/place/Test+Cafe/data=1',
+        'website': None,
+    }]}}
+    
+    leads = fetch_results_via_cdp(driver)
+    
+    driver.execute_cdp_cmd.assert_called_once()
+    assert driver.execute_cdp_cmd.call_args.args[0] == 'Runtime.evaluate'
+    assert leads == [{
+        'business_name': 'Test Cafe',
+        'address': '12 Main Street',
+        'phone': '',
+        'website': '',
+        'rating': '4.5 stars (120)',
+        'notes': 'Google Maps URL: https://www.google.com/maps/place/Test+Cafe/data=1',
+        'url': 'https://www.google.com/maps/place/Test+Cafe/data=1',
+    }]
+
+def test_merge_listing_details_fills_gaps_from_cards():
+    """Test that listing leads keep their own fields and take the rest from their cards."""
+    url = 'https://www.google.com/maps/place/Test+Cafe/data=1'
+    cards = [{'url': url, 'business_name': 'Test Cafe', 'address': '12 Main Street', 'phone': '', 'rating': '4.5 stars'}]
+    listing = {'url': url, 'business_name': 'Test Cafe', 'phone': '555-123-4567', 'rating': '4.6 (120 reviews)'}
+    
+    with patch('scrapers.google_maps.scrape_listings_parallel', return_value=iter([listing])) as scrape_listings:
+        leads = list(merge_listing_details(cards, max_workers=4))
+    
+    scrape_listings.assert_called_once_with([url], max_workers=4)
+    assert leads == [{**listing, 'address': '12 Main Street'}]
+
+@contextmanager
+def _fake_search_driver():
+    yield MagicMock()
+
+def test_scrape_iter_scrapes_listings_missing_from_search_responses():
+    """Test that listings the search XHRs didn't cover are still scraped."""
+    urls = [
+        'https://www.google.com/maps/place/Test+Cafe/data=1',
+        'https://www.google.com/maps/place/Corner+Bakery/data=2',
+    ]
+    search_leads = [{'business_name': 'Test Cafe', 'phone': ''}]
+    
+    with patch('scrapers.google_maps.borrow_search_driver', _fake_search_driver), \
+         patch('scrapers.google_maps.collect_result_cards', return_value=[{'url': url} for url in urls]), \
+         patch('scrapers.google_maps.read_search_responses', return_value=search_leads), \
+         patch('scrapers.google_maps.scrape_listings_parallel',
+               return_value=iter([{'business_name': 'Corner Bakery', 'phone': ''}])) as scrape_listings:
+        leads = list(scrape_iter('cafe', 'test city', max_results=5))
+    
+    scrape_listings.assert_called_once_with(urls[1:], max_workers=10)
+    assert [lead['business_name'] for lead in leads] == ['Test Cafe', 'Corner Bakery']
+
+def test_scrape_many_skips_listings_covered_by_search_responses():
+    """Test that batch searches also take leads from the search XHRs first."""
+    urls = [
+        'https://www.google.com/maps/place/Test+Cafe/data=1',
+        'https://www.google.com/maps/place/Corner+Bakery/data=2',
+    ]
+    search_leads = [{'business_name': 'Test Cafe', 'phone': ''}]
+    
+    with patch('scrapers.google_maps.borrow_search_driver', _fake_search_driver), \
+         patch('scrapers.google_maps.collect_result_cards', return_value=[{'url': url} for url in urls]), \
+         patch('scrapers.google_maps.read_search_responses', return_value=search_leads), \
+         patch('scrapers.google_maps.scrape_listings_parallel',
+               return_value=iter([{'business_name': 'Corner Bakery', 'phone': ''}])) as scrape_listings:
+        results = scrape_many([('cafe', 'test city')], max_results=5)
+    
+    scrape_listings.assert_called_once_with(urls[1:], max_workers=10)
+    assert [lead['business_name'] for lead in results[('cafe', 'test city')]] == ['Test Cafe', 'Corner Bakery']
+
+def test_scrape_listing_keeps_the_browser_on_page_errors():
+    """Test that a slow page yields no lead, while a dead session reaches the pool."""
+    driver = MagicMock()
+    driver.get.side_effect = TimeoutException("page load timed out")
+    
+    assert _scrape_listing('https://www.google.com/maps/place/Test+Cafe', driver) is None
+    
+    driver.get.side_effect = InvalidSessionIdException("session deleted")
+    with pytest.raises(InvalidSessionIdException):
+        _scrape_listing('https://www.google.com/maps/place/Test+Cafe', driver)
+
+def test_listing_takes_one_rate_token_across_http_and_browser():
+    """Test that a listing falling back to the browser still takes a single LIMITER token."""
+    limiter = MagicMock()
+    url = 'https://www.google.com/maps/place/Test+Cafe'
+    
+    with patch('scrapers.google_maps.LIMITER', limiter), \
+         patch('scrapers.google_maps.MAPS_MIN_DELAY', 0), \
+         patch('scrapers.google_maps.MAPS_MAX_DELAY', 0), \
+         patch('scrapers.google_maps.fetch_listing_http', return_value=None), \
+         patch('scrapers.google_maps._scrape_listing', return_value={'business_name': 'Test Cafe'}):
+        lead = scrape_single_listing(url, pool=MagicMock())
+    
+    assert lead == {'business_name': 'Test Cafe'}
+    limiter.__enter__.assert_called_once()
+
+def test_lead_index_ignores_unicode_phone_separators():
+    """Test that non-ASCII separators don't split one phone into two dedup keys."""
+    index = LeadIndex([{'business_name': 'Test Cafe', 'phone': '(555) 123-4567'}])
+    
+    for phone in ('555 123‑4567', '555 123 4567', '（555）123－4567'):
+        assert {'business_name': 'Other', 'phone': phone} in index
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="uses fcntl in the helper process")
+def test_profile_slots_are_locked_across_processes(tmp_path):
+    """Test that a profile slot locked by another process is skipped."""
+    holder = subprocess.Popen([
+        sys.executable, '-c',
+        'import fcntl, sys, time; f = open(sys.argv[1], "a+"); '
+        'fcntl.flock(f, fcntl.LOCK_EX); print("locked", flush=True); time.sleep(30)',
+        str(tmp_path / 'chrome-profile-0.lock')
+    ], stdout=subprocess.PIPE, text=True)
+    try:
+        assert holder.stdout.readline().strip() == 'locked'
+        with patch('scrapers.google_maps.CHROME_PROFILE_ROOT', str(tmp_path)):
+            first = _claim_profile_slot()
+            second = _claim_profile_slot()
+            _release_profile_slot(first)
+            reused = _claim_profile_slot()
+            _release_profile_slot(second)
+            _release_profile_slot(reused)
+    finally:
+        holder.kill()
+        holder.wait()
+    
+    assert (first, second, reused) == (1, 2, 1)
+
+def test_profile_slots_are_capped(tmp_path):
+    """Test that claims past CHROME_PROFILE_SLOTS get no slot instead of new lock files."""
+    with patch('scrapers.google_maps.CHROME_PROFILE_ROOT', str(tmp_path)), \
+         patch('scrapers.google_maps.CHROME_PROFILE_SLOTS', 2):
+        slots = [_claim_profile_slot() for _ in range(3)]
+        for slot in slots:
+            _release_profile_slot(slot)
+    
+    assert slots == [0, 1, None]
+    assert sorted(os.listdir(tmp_path)) == ['chrome-profile-0.lock', 'chrome-profile-1.lock']
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="patches fcntl.flock")
+def test_profile_slots_fall_back_when_locking_is_unsupported(tmp_path):
+    """Test that a filesystem without locks gives a throwaway profile rather than a spin."""
+    with patch('scrapers.google_maps.CHROME_PROFILE_ROOT', str(tmp_path)), \
+         patch('scrapers.google_maps.fcntl.flock', side_effect=OSError(errno.ENOLCK, 'No locks available')):
+        assert _claim_profile_slot() is None
+    
+    assert os.listdir(tmp_path) == ['chrome-profile-0.lock']
@@ -0,0 +1,109 @@
+"""Tests for web utilities."""
+import pytest
+from unittest.mock import MagicMock, patch
+from selenium.common.exceptions import WebDriverException
+from utils.web import DriverPool, TokenBucket
+
+@pytest.fixture
+def pool():
+    """Create a DriverPool over a factory of mock drivers."""
+    factory = MagicMock(side_effect=lambda: MagicMock())
+    teardown = MagicMock()
+    return DriverPool(factory, teardown=teardown)
+
+def test_driver_pool_reuses_idle_driver(pool):
+    """Test that a returned driver is handed out again instead of a new one."""
+    with pool.acquire() as first:
+        pass
+    with pool.acquire() as second:
+        pass
+    
+    assert first is second
+    assert pool.factory.call_count == 1
+    pool.teardown.assert_not_called()
+
+def test_driver_pool_discards_broken_driver(pool):
+    """Test that a driver raising WebDriverException is quit and replaced."""
+    with pytest.raises(WebDriverException):
+        with pool.acquire() as broken:
+            raise WebDriverException("crashed")
+    with pool.acquire() as replacement:
+        pass
+    
+    assert replacement is not broken
+    pool.teardown.assert_called_once_with(broken)
+
+@pytest.mark.parametrize("error", [TimeoutError, KeyError, GeneratorExit])
+def test_driver_pool_returns_driver_on_other_errors(pool, error):
+    """Test that other exceptions hand the driver back rather than orphaning it."""
+    with pytest.raises(error):
+        with pool.acquire() as driver:
+            raise error()
+    with pool.acquire() as again:
+        pass
+    
+    assert again is driver
+    assert pool.factory.call_count == 1
+
+def test_driver_pool_recycles_worn_out_driver():
+    """Test that a driver is replaced after max_uses borrows."""
+    teardown = MagicMock()
+    pool = DriverPool(lambda: MagicMock(), teardown=teardown, max_uses=2)
+    
+    with pool.acquire() as first:
+        pass
+    with pool.acquire() as second:
+        pass
+    with pool.acquire() as third:
+        pass
+    
+    assert first is second
+    assert third is not first
+    teardown.assert_called_once_with(first)
+
+def test_driver_pool_close_quits_every_driver(pool):
+    """Test that close tears down idle drivers and those still borrowed."""
+    with pool.acquire() as first:
+        with pool.acquire() as second:
+            pass
+    with pool.acquire() as borrowed:
+        pool.close()
+    
+    assert {call.args[0] for call in pool.teardown.call_args_list} == {first, second}
+    assert borrowed in (first, second)
+
+def test_driver_pool_never_hands_out_closed_drivers(pool):
+    """Test that close drains idle drivers and drops ones handed back later."""
+    with pool.acquire() as first:
+        with pool.acquire() as second:
+            pass
+    with pool.acquire() as borrowed:
+        pool.close()
+    with pool.acquire() as fresh:
+        pass
+    
+    assert borrowed in (first, second)
+    assert fresh not in (first, second)
+    torn_down = [call.args[0] for call in pool.teardown.call_args_list]
+    assert sorted(map(id, torn_down)) == sorted(map(id, [first, second, fresh]))
+
+def test_token_bucket_bursts_then_waits():
+    """Test that a full bucket allows a burst, then sleeps for the refill."""
+    clock = [100.0]
+    sleeps = []
+    
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+    
+    with patch('utils.web.time.monotonic', side_effect=lambda: clock[0]), \
+         patch('utils.web.time.sleep', side_effect=fake_sleep):
+        bucket = TokenBucket(max_calls=2, period=1.0)
+        bucket.acquire()
+        bucket.acquire()
+        assert sleeps == []
+        
+        with bucket:
+            pass
+    
+    assert sleeps == [pytest.approx(0.5)]
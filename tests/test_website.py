@@ -5,11 +5,21 @@ from bs4 import BeautifulSoup
 from scrapers.website import (
     extract_emails,
     extract_social_links,
+    mailto_addresses,
     detect_technologies,
     scrape_website,
-    enrich
+    enrich,
+    _canonical_url,
+    _scrape_page
 )
 
+@pytest.fixture(autouse=True)
+def clear_page_cache():
+    """Start every test with an empty per-URL page cache."""
+    _scrape_page.cache_clear()
+    yield
+    _scrape_page.cache_clear()
+
 @pytest.fixture
 def sample_html():
     """Sample HTML content for testing."""
@@ -53,6 +63,17 @@ def test_extract_emails():
     assert "support@test.com" in emails
     assert "invalid@email" not in emails
 
+def test_extract_emails_skips_asset_names():
+    """Test that retina asset names in raw HTML aren't taken for emails."""
+    html = '<img src="/img/logo@2x.png"><a href="mailto:info@example.com">Mail</a>'
+    assert extract_emails(html) == {"info@example.com"}
+
+def test_mailto_addresses():
+    """Test mailto parsing, including cc and bcc recipients."""
+    href = "mailto:info@example.com?subject=Hi&cc=sales@example.com&bcc=a%40example.com"
+    assert mailto_addresses(href) == {"info@example.com", "sales@example.com", "a@example.com"}
+    assert mailto_addresses("https://example.com") == set()
+
 def test_extract_social_links(sample_html):
     """Test social media link extraction."""
     soup = BeautifulSoup(sample_html, 'html.parser')
@@ -69,11 +90,14 @@ def test_detect_technologies(sample_html):
     assert "wordpress" in technologies
     assert len(technologies) == 1
 
-@patch('requests.get')
+@patch('scrapers.website._SESSION.get')
 def test_scrape_website(mock_get, sample_html):
     """Test website scraping with mocked response."""
     mock_response = MagicMock()
-    mock_response.text = sample_html
+    mock_response.status_code = 200
+    mock_response.headers = {'Content-Type': 'text/html; charset=utf-8'}
+    mock_response.encoding = 'utf-8'
+    mock_response.iter_content.return_value = [sample_html.encode('utf-8')]
     mock_response.raise_for_status.return_value = None
     mock_get.return_value = mock_response
     
@@ -84,6 +108,53 @@ def test_scrape_website(mock_get, sample_html):
     assert len(result['social_links']) == 3
     assert len(result['technologies']) == 1
 
+@patch('scrapers.website._SESSION.get')
+def test_scrape_website_skips_non_html(mock_get):
+    """Test that non-HTML responses are skipped without reading the body."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.headers = {'Content-Type': 'application/pdf'}
+    mock_response.raise_for_status.return_value = None
+    mock_get.return_value = mock_response
+    
+    result = scrape_website("https://example.com/brochure.pdf")
+    
+    assert result['emails'] == set()
+    mock_response.iter_content.assert_not_called()
+
+@pytest.mark.parametrize("first_url, second_url", [
+    ("https://Chain.example/", "chain.example#contact"),
+    ("https://chain.example/menu/", "https://chain.example/menu"),
+    ("https://chain.example/menu#hours", "https://chain.example/menu"),
+    ("https://CHAIN.EXAMPLE:443/menu", "https://chain.example/menu"),
+    ("http://chain.example:80/", "http://Chain.Example"),
+])
+@patch('scrapers.website._SESSION.get')
+def test_scrape_website_caches_by_canonical_url(mock_get, first_url, second_url, sample_html):
+    """Test that URL variants of one website are fetched only once."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.headers = {'Content-Type': 'text/html'}
+    mock_response.encoding = 'utf-8'
+    mock_response.iter_content.return_value = [sample_html.encode('utf-8')]
+    mock_get.return_value = mock_response
+    
+    first = scrape_website(first_url)
+    first['emails'].clear()
+    second = scrape_website(second_url)
+    
+    assert mock_get.call_count == 1
+    assert "test@example.com" in second['emails']
+
+@pytest.mark.parametrize("url, other", [
+    ("https://chain.example/menu", "https://chain.example/contact"),
+    ("https://chain.example:8443/", "https://chain.example/"),
+    ("http://chain.example/", "https://chain.example/"),
+])
+def test_canonical_url_keeps_distinct_pages_apart(url, other):
+    """Test that different paths, ports and schemes get their own cache keys."""
+    assert _canonical_url(url) != _canonical_url(other)
+
 def test_scrape_website_invalid_url():
     """Test website scraping with invalid URL."""
     result = scrape_website("")
@@ -1,21 +1,36 @@
 """AI helper utilities for Gemini API integration."""
 import os
-from typing import Optional, Dict, Any
+import functools
+import re
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 from dotenv import load_dotenv
 import google.generativeai as genai
+from utils.config import get_config
 from utils.logger import setup_logger
-import yaml
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # Fallback to the stdlib parser when orjson isn't installed
+    _json_loads = json.loads
 
 logger = setup_logger(__name__)
 
+# Characters that matter when matching braces; everything else is skipped
+JSON_TOKEN_RE = re.compile(r'[{}"\\]')
+
 # Load environment variables
 load_dotenv()
 
+# Set once genai.configure has succeeded; the key is process-wide
+_gemini_initialized = False
+
 def load_config() -> dict:
     """Load configuration from config.yaml."""
     try:
-        with open("config.yaml", "r") as f:
-            return yaml.safe_load(f)
+        return get_config()
     except Exception as e:
         logger.error(f"Failed to load config: {e}")
         return {}
@@ -24,9 +39,16 @@ def initialize_gemini() -> bool:
     """
     Initialize Gemini API with API key from environment.
     
+    Only the first successful call configures the client; later calls
+    return straight away.
+    
     Returns:
         True if successful, False otherwise
     """
+    global _gemini_initialized
+    if _gemini_initialized:
+        return True
+    
     api_key = os.getenv('GEMINI_API_KEY')
     
     if not api_key or api_key == 'your_gemini_api_key_here':
@@ -35,16 +57,21 @@ def initialize_gemini() -> bool:
     
     try:
         genai.configure(api_key=api_key)
+        _gemini_initialized = True
         logger.info("Gemini API initialized successfully")
         return True
     except Exception as e:
         logger.error(f"Failed to initialize Gemini API: {e}")
         return False
 
+@functools.lru_cache(maxsize=None)
 def get_gemini_model(model_name: Optional[str] = None) -> Any:
     """
     Get configured Gemini model instance.
     
+    Models are built once per model name and shared by later calls; a
+    failure raises and is not cached.
+    
     Args:
         model_name: Optional model name override
         
@@ -75,6 +102,21 @@ def get_gemini_model(model_name: Optional[str] = None) -> Any:
     
     return model
 
+def _generate_with(model: Any, prompt: str) -> Optional[str]:
+    """Run one prompt against an already configured model."""
+    try:
+        response = model.generate_content(prompt)
+        
+        if response and response.text:
+            return response.text
+        else:
+            logger.warning("Empty response from Gemini API")
+            return None
+            
+    except Exception as e:
+        logger.error(f"Error generating text with Gemini: {e}")
+        return None
+
 def generate_text(prompt: str, model_name: Optional[str] = None) -> Optional[str]:
     """
     Generate text using Gemini API.
@@ -88,17 +130,48 @@ def generate_text(prompt: str, model_name: Optional[str] = None) -> Optional[str
     """
     try:
         model = get_gemini_model(model_name)
-        response = model.generate_content(prompt)
-        
-        if response and response.text:
-            return response.text
-        else:
-            logger.warning("Empty response from Gemini API")
-            return None
-            
     except Exception as e:
         logger.error(f"Error generating text with Gemini: {e}")
         return None
+    
+    return _generate_with(model, prompt)
+
+def generate_many(
+    prompts: List[str],
+    model_name: Optional[str] = None,
+    max_concurrent: Optional[int] = None
+) -> List[Optional[str]]:
+    """
+    Generate text for several prompts with their API calls in flight together.
+    
+    Each call is mostly network wait, so running a few at once takes about
+    as long as the slowest one instead of the sum of all of them.
+    
+    Args:
+        prompts: Input prompts
+        model_name: Optional model name override
+        max_concurrent: Requests in flight at once; defaults to
+            ai_agent.model.max_concurrent in config.yaml
+        
+    Returns:
+        Generated text or None for each prompt, in the order given
+    """
+    if not prompts:
+        return []
+    
+    try:
+        # Configure and build the model once for the whole batch
+        model = get_gemini_model(model_name)
+    except Exception as e:
+        logger.error(f"Error generating text with Gemini: {e}")
+        return [None] * len(prompts)
+    
+    if max_concurrent is None:
+        model_config = load_config().get('ai_agent', {}).get('model', {})
+        max_concurrent = model_config.get('max_concurrent', 4)
+    
+    with ThreadPoolExecutor(max_workers=min(max_concurrent, len(prompts))) as executor:
+        return list(executor.map(lambda prompt: _generate_with(model, prompt), prompts))
 
 def generate_structured_response(prompt: str, system_context: Optional[str] = None) -> Optional[str]:
     """
@@ -117,6 +190,48 @@ def generate_structured_response(prompt: str, system_context: Optional[str] = No
     
     return generate_text(full_prompt)
 
+def _json_spans(text: str) -> List[Tuple[int, int]]:
+    """
+    Find every balanced {...} span in a single left-to-right pass.
+    
+    Only brace, quote and backslash characters are visited, and braces
+    inside JSON strings don't count. A brace that never closes doesn't
+    swallow the rest of the text, so spans after it are still found
+    without scanning the text again.
+    
+    Args:
+        text: Text to scan
+        
+    Returns:
+        (start, end) slice bounds of each span, ordered by start
+    """
+    spans = []
+    open_at: List[int] = []
+    in_string = False
+    escaped_until = -1
+    for match in JSON_TOKEN_RE.finditer(text):
+        index = match.start()
+        if index < escaped_until:
+            continue
+        char = match.group()
+        if in_string:
+            if char == '\\':
+                escaped_until = index + 2
+            elif char == '"':
+                in_string = False
+        elif char == '{':
+            open_at.append(index)
+        elif not open_at:
+            # Quotes and closing braces in prose outside any object
+            continue
+        elif char == '"':
+            in_string = True
+        elif char == '}':
+            spans.append((open_at.pop(), index + 1))
+    
+    spans.sort()
+    return spans
+
 def extract_json_from_response(response_text: str) -> Optional[Dict]:
     """
     Extract JSON from AI response that might contain markdown code blocks.
@@ -127,35 +242,26 @@ def extract_json_from_response(response_text: str) -> Optional[Dict]:
     Returns:
         Parsed JSON dictionary or None
     """
-    import json
-    import re
-    
     if not response_text:
         return None
     
-    # Try to extract JSON from markdown code blocks
-    json_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-    matches = re.findall(json_pattern, response_text, re.DOTALL)
-    
-    if matches:
+    # Most responses are bare JSON objects, which parse without any
+    # scanning. orjson.JSONDecodeError subclasses ValueError, as json's does
+    stripped = response_text.strip()
+    if stripped.startswith('{'):
         try:
-            return json.loads(matches[0])
-        except json.JSONDecodeError:
+            return _json_loads(stripped)
+        except ValueError:
             pass
     
-    # Try to parse the entire response as JSON
-    try:
-        return json.loads(response_text)
-    except json.JSONDecodeError:
-        # Try to find JSON-like structure
-        json_start = response_text.find('{')
-        json_end = response_text.rfind('}') + 1
-        
-        if json_start >= 0 and json_end > json_start:
-            try:
-                return json.loads(response_text[json_start:json_end])
-            except json.JSONDecodeError:
-                pass
+    # Otherwise take the first balanced {...} that parses; this covers
+    # markdown code blocks and JSON wrapped in prose alike. A stray brace
+    # that never closes or doesn't parse moves on to the next span
+    for start, end in _json_spans(response_text):
+        try:
+            return _json_loads(response_text[start:end])
+        except ValueError:
+            pass
     
     logger.warning("Could not extract JSON from response")
     return None
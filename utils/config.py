@@ -0,0 +1,24 @@
+"""Shared access to config.yaml for the Lead Scraper project."""
+import functools
+import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    # Fallback to the pure-Python loader when PyYAML lacks libyaml
+    from yaml import SafeLoader
+
+CONFIG_PATH = "config.yaml"
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> dict:
+    """
+    Load config.yaml once per process and return the parsed mapping.
+    
+    Every caller gets the same dict, so treat it as read-only. Call
+    get_config.cache_clear() to pick up changes to the file.
+    
+    Returns:
+        Parsed configuration dictionary
+    """
+    with open(CONFIG_PATH, "r") as f:
+        return yaml.load(f, Loader=SafeLoader) or {}
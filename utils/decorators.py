@@ -1,18 +1,17 @@
 """Decorators for the lead scraper project."""
 import functools
+import random
 import time
 from typing import Any, Callable, TypeVar
-import yaml
+from .config import get_config
 from .logger import setup_logger
 
 logger = setup_logger(__name__)
 T = TypeVar("T")
 
 def load_retry_config() -> dict:
-    """Load retry configuration from config.yaml."""
-    with open("config.yaml", "r") as f:
-        config = yaml.safe_load(f)
-    return config["retry"]
+    """Return the retry section of config.yaml, parsed once per process."""
+    return get_config()["retry"]
 
 def retry_with_backoff(func: Callable[..., T]) -> Callable[..., T]:
     """
@@ -30,6 +29,9 @@ def retry_with_backoff(func: Callable[..., T]) -> Callable[..., T]:
         max_attempts = config["max_attempts"]
         initial_delay = config["initial_delay"]
         backoff_factor = config["backoff_factor"]
+        # Optional overall budget in seconds across all attempts
+        max_elapsed = config.get("max_elapsed")
+        deadline = time.monotonic() + max_elapsed if max_elapsed else None
         
         attempt = 0
         while attempt < max_attempts:
@@ -43,7 +45,17 @@ def retry_with_backoff(func: Callable[..., T]) -> Callable[..., T]:
                     )
                     raise
                 
+                # Jitter spreads out workers that failed together so they
+                # don't all retry against the same host at the same instant
                 delay = initial_delay * (backoff_factor ** (attempt - 1))
+                delay *= random.uniform(0.5, 1.5)
+                if deadline is not None and time.monotonic() + delay > deadline:
+                    logger.error(
+                        f"Giving up after {attempt} attempts; retry budget of "
+                        f"{max_elapsed}s exhausted. Error: {str(e)}"
+                    )
+                    raise
+                
                 logger.warning(
                     f"Attempt {attempt} failed. Retrying in {delay:.1f}s. Error: {str(e)}"
                 )
@@ -1,13 +1,62 @@
 """Logging utilities for the Lead Scraper project."""
 import os
+import atexit
 import logging
+import queue
+import threading
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+# Every logger enqueues its records here; one background listener does the
+# formatting and file/console I/O so scraper threads never block on writes
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_listener = None
+_listener_lock = threading.Lock()
+
+def _start_listener() -> None:
+    """Start the shared file and console listener on first use."""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return
+        
+        # Create logs directory if it doesn't exist
+        log_dir = Path("data")
+        log_dir.mkdir(exist_ok=True)
+        
+        # Log file path with timestamp
+        log_file = log_dir / "scraper.log"
+        
+        # Create formatter
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        
+        # File handler with UTF-8 encoding to handle special characters
+        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler.setFormatter(formatter)
+        handlers = [file_handler]
+        
+        # Console handler with utf-8 encoding if possible
+        try:
+            # Check if console supports UTF-8
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(formatter)
+            handlers.append(console_handler)
+        except Exception:
+            pass  # Silently skip console handler if it fails
+        
+        _listener = QueueListener(_log_queue, *handlers)
+        _listener.start()
+        # Flush whatever is still queued before the interpreter exits
+        atexit.register(_listener.stop)
+
 def setup_logger(name, level=logging.INFO):
     """
     Set up a logger with file and console handlers.
     
+    Records are handed to a queue and written by a shared background
+    listener, so logging calls don't wait on disk or console I/O.
+    
     Args:
         name: Logger name (typically __name__)
         level: Logging level
@@ -15,10 +64,6 @@ def setup_logger(name, level=logging.INFO):
     Returns:
         Configured logger instance
     """
-    # Create logs directory if it doesn't exist
-    log_dir = Path("data")
-    log_dir.mkdir(exist_ok=True)
-    
     # Create a logger
     logger = logging.getLogger(name)
     logger.setLevel(level)
@@ -27,25 +72,7 @@ def setup_logger(name, level=logging.INFO):
     if logger.handlers:
         return logger
     
-    # Log file path with timestamp
-    log_file = log_dir / "scraper.log"
-
-    # Create formatter
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    
-    # File handler with UTF-8 encoding to handle special characters
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
-    
-    # Console handler with utf-8 encoding if possible
-    try:
-        # Check if console supports UTF-8
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        console_handler.setLevel(level)
-        logger.addHandler(console_handler)
-    except Exception:
-        pass  # Silently skip console handler if it fails
+    _start_listener()
+    logger.addHandler(QueueHandler(_log_queue))
     
-    return logger
\ No newline at end of file
+    return logger
@@ -1,11 +1,17 @@
 """Web utilities for browser automation."""
+import functools
+import queue
 import random
-from typing import Dict, Optional
-import yaml
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
+from .config import get_config
 from .logger import setup_logger
 from .decorators import retry_with_backoff
 
@@ -13,16 +19,36 @@ logger = setup_logger(__name__)
 
 def load_config() -> dict:
     """Load web configuration from config.yaml."""
-    with open("config.yaml", "r") as f:
-        config = yaml.safe_load(f)
-    return config
+    return get_config()
 
-def setup_chrome_options(headless: bool = True) -> Options:
+@functools.lru_cache(maxsize=1)
+def chromedriver_path() -> str:
+    """
+    Resolve the ChromeDriver binary once per process.
+    
+    ChromeDriverManager().install() checks its cache on disk and may query
+    for a newer driver; retried or pooled driver launches reuse the first
+    answer. Call chromedriver_path.cache_clear() to resolve it again.
+    
+    Returns:
+        Path to the ChromeDriver executable
+    """
+    return ChromeDriverManager().install()
+
+def setup_chrome_options(
+    headless: bool = True,
+    performance_log: bool = False,
+    fast_mode: bool = False
+) -> Options:
     """
     Set up Chrome options for Selenium.
     
     Args:
         headless: Whether to run Chrome in headless mode
+        performance_log: Whether to record DevTools network events, readable
+            with driver.get_log('performance')
+        fast_mode: Whether to stop Chrome from loading images at all; leave
+            off for pages whose thumbnails are interacted with
         
     Returns:
         Chrome options object
@@ -30,13 +56,23 @@ def setup_chrome_options(headless: bool = True) -> Options:
     options = Options()
     
     if headless:
-        options.add_argument("--headless")
+        # The new headless mode runs the full browser without a window
+        options.add_argument("--headless=new")
     
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-gpu")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-background-networking")
     options.add_argument("--window-size=1920,1080")
     
+    if fast_mode:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+    
+    # Return from driver.get at DOMContentLoaded; callers wait explicitly
+    # for the elements they need instead of every streamed subresource
+    options.page_load_strategy = "eager"
+    
     # Disable automation flags and infobar
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option("useAutomationExtension", False)
@@ -47,50 +83,95 @@ def setup_chrome_options(headless: bool = True) -> Options:
         "profile.password_manager_enabled": False,
         "profile.default_content_setting_values.notifications": 2
     }
+    if fast_mode:
+        prefs["profile.managed_default_content_settings.images"] = 2
     options.add_experimental_option("prefs", prefs)
     
+    if performance_log:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    
     return options
 
-def setup_chrome_driver(headless: bool = True) -> webdriver.Chrome:
+def setup_chrome_driver(
+    headless: bool = True,
+    performance_log: bool = False,
+    fast_mode: bool = False
+) -> webdriver.Chrome:
     """
     Set up Chrome driver with configured options.
     
     Args:
         headless: Whether to run Chrome in headless mode
+        performance_log: Whether to record DevTools network events
+        fast_mode: Whether to stop Chrome from loading images at all
         
     Returns:
         Configured Chrome webdriver instance
     """
     logger.info(f"Setting up Chrome driver (headless={headless})")
     
-    options = setup_chrome_options(headless)
-    service = Service(ChromeDriverManager().install())
+    options = setup_chrome_options(headless, performance_log, fast_mode)
+    service = Service(chromedriver_path())
     
     try:
         driver = webdriver.Chrome(service=service, options=options)
         driver.set_page_load_timeout(60)  # Set page load timeout to 60 seconds
+        driver.implicitly_wait(0)  # Explicit waits only; no hidden double polling
         return driver
     except Exception as e:
         logger.error(f"Failed to setup Chrome driver: {str(e)}")
         raise
 
+def attach_chrome_driver(debugger_address: str, performance_log: bool = False) -> webdriver.Chrome:
+    """
+    Attach to a Chrome already running with --remote-debugging-port.
+    
+    Launch options don't apply to a running browser, so only the attach
+    address and capabilities are set. quit() on the returned driver leaves
+    that browser running.
+    
+    Args:
+        debugger_address: host:port of the browser's debugging endpoint
+        performance_log: Whether to record DevTools network events
+        
+    Returns:
+        Chrome webdriver instance controlling the running browser
+    """
+    logger.info(f"Attaching to Chrome at {debugger_address}")
+    
+    options = Options()
+    options.add_experimental_option("debuggerAddress", debugger_address)
+    options.page_load_strategy = "eager"
+    if performance_log:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    service = Service(chromedriver_path())
+    
+    try:
+        driver = webdriver.Chrome(service=service, options=options)
+        driver.set_page_load_timeout(60)
+        driver.implicitly_wait(0)
+        return driver
+    except Exception as e:
+        logger.error(f"Failed to attach to Chrome at {debugger_address}: {str(e)}")
+        raise
+
+USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.77 Safari/537.36 Edg/91.0.864.41",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1"
+)
+
 def get_random_user_agent() -> str:
     """
     Get a random user agent string.
     
     Returns:
-        Random user agent string
+        Random user agent string from USER_AGENTS
     """
-    user_agents = [
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15",
-        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.77 Safari/537.36 Edg/91.0.864.41",
-        "Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1"
-    ]
-    
-    return random.choice(user_agents)
+    return random.choice(USER_AGENTS)
 
 @retry_with_backoff
 def create_browser_session(headless: bool = True) -> webdriver.Chrome:
@@ -104,4 +185,153 @@ def create_browser_session(headless: bool = True) -> webdriver.Chrome:
         Configured Chrome WebDriver instance
     """
     logger.info("Creating new browser session...")
-    return setup_chrome_driver(headless)
\ No newline at end of file
+    return setup_chrome_driver(headless)
+
+class DriverPool:
+    """Thread-safe pool of reusable WebDriver instances."""
+    
+    def __init__(
+        self,
+        factory: Callable[[], webdriver.Chrome],
+        teardown: Optional[Callable[[webdriver.Chrome], None]] = None,
+        max_uses: Optional[int] = None
+    ):
+        """
+        Initialize an empty pool; drivers are created on first demand.
+        
+        Args:
+            factory: Callable that builds a new driver
+            teardown: Callable that disposes of a driver (default: quit)
+            max_uses: Borrows after which a driver is quit and replaced,
+                since long-lived browsers slow down; None keeps drivers
+                for the pool's lifetime
+        """
+        self.factory = factory
+        self.teardown = teardown or (lambda driver: driver.quit())
+        self.max_uses = max_uses
+        self._idle: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+        self._drivers: List[webdriver.Chrome] = []
+        self._uses: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    @contextmanager
+    def acquire(self) -> Iterator[webdriver.Chrome]:
+        """
+        Borrow a driver, creating one if none is idle.
+        
+        A driver that raises a WebDriverException, or has been borrowed
+        max_uses times, is quit and dropped instead of being returned to
+        the pool. Any other exception leaving the block, including
+        GeneratorExit from a consumer that stopped early, hands the
+        driver back so it isn't orphaned until close().
+        
+        Yields:
+            A WebDriver instance owned by the caller until the block exits
+        """
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            driver = self.factory()
+            with self._lock:
+                self._drivers.append(driver)
+        
+        try:
+            yield driver
+        except WebDriverException:
+            self._discard(driver)
+            raise
+        except BaseException:
+            self._release(driver)
+            raise
+        else:
+            self._release(driver)
+    
+    def _release(self, driver: webdriver.Chrome) -> None:
+        """Return a healthy driver to the idle queue, or quit it if worn out or the pool is closed."""
+        if not self._worn_out(driver):
+            with self._lock:
+                if not self._closed:
+                    self._idle.put(driver)
+                    return
+        self._discard(driver)
+    
+    def _worn_out(self, driver: webdriver.Chrome) -> bool:
+        """Count a borrow of driver, returning True once it reaches max_uses."""
+        if self.max_uses is None:
+            return False
+        with self._lock:
+            uses = self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+        return uses >= self.max_uses
+    
+    def _discard(self, driver: webdriver.Chrome) -> None:
+        """Quit a broken or worn-out driver and forget it."""
+        with self._lock:
+            if driver not in self._drivers:
+                # Borrowed across close(), which already quit it
+                return
+            self._drivers.remove(driver)
+            self._uses.pop(id(driver), None)
+        try:
+            self.teardown(driver)
+        except Exception as e:
+            logger.debug(f"Error quitting discarded driver: {str(e)}")
+    
+    def close(self) -> None:
+        """
+        Quit every driver the pool created, including borrowed ones.
+        
+        Drivers handed back afterwards are dropped rather than re-queued,
+        and any later acquire() gets a fresh driver that is quit on return.
+        """
+        with self._lock:
+            self._closed = True
+            drivers, self._drivers = self._drivers, []
+            self._uses.clear()
+            while not self._idle.empty():
+                self._idle.get_nowait()
+        for driver in drivers:
+            try:
+                self.teardown(driver)
+            except Exception as e:
+                logger.debug(f"Error quitting pooled driver: {str(e)}")
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing max_calls per period, with bursts."""
+    
+    def __init__(self, max_calls: int, period: float):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            max_calls: Bucket capacity, i.e. calls allowed per period
+            period: Seconds over which max_calls tokens are refilled
+        """
+        self.capacity = max_calls
+        self.rate = max_calls / period
+        self._tokens = float(max_calls)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+    
+    def __enter__(self) -> "TokenBucket":
+        self.acquire()
+        return self
+    
+    def __exit__(self, *exc_info: object) -> None:
+        return None